@@ -5,10 +5,9 @@ from typing import (
     Any,
     Annotated,
     Callable,
-    Generator,
-    get_args,
+    TypeAlias,
 )
-from the_test_framework.facilities import origin_of_func
+from the_test_framework.facilities import origin_of_func, weakly_memoized
 
 from .argument_flag import ArgumentFlag, IsUUTSetupData
 
@@ -16,13 +15,76 @@ from .argument_flag import ArgumentFlag, IsUUTSetupData
 logger = getLogger(__name__)
 
 
-def _parameter_with_certain_flag(
-        func: Callable,
-        annotated_with: type[ArgumentFlag]
-) -> Generator[str, None, None]:
-    for param_name, param in inspect.signature(func).parameters.items():
-        if annotated_with in get_args(param.annotation):
-            yield param_name
+# parameter name indexed by ArgumentFlag or by type annotation; None marks
+# keys which apply to more than one parameter
+ParameterIndex: TypeAlias = dict[Any, str | None]
+
+# placeholder for keys which apply to no parameter at all
+_UNINDEXED = object()
+
+
+@weakly_memoized
+def _cached_signature(func: Callable) -> inspect.Signature:
+    """get the signature of `func`, preferring a precomputed `__signature__`
+
+    Plain functions carry their signature as `__signature__` once it was
+    computed (or when a decorator provided one), which spares
+    `inspect.signature()` from unwrapping and rebuilding it. Bound methods
+    are left to `inspect.signature()`, as they'd expose the `__signature__`
+    of their underlying function, which still includes `self`.
+    """
+    if not inspect.isfunction(func):
+        return inspect.signature(func)
+    signature = getattr(func, "__signature__", None)
+    if isinstance(signature, inspect.Signature):
+        return signature
+    signature = inspect.signature(func)
+    try:
+        func.__signature__ = signature
+    except AttributeError:
+        pass
+    return signature
+
+
+_EMPTY = inspect.Parameter.empty
+
+
+def _add_to_index(index: ParameterIndex, key: Any, param_name: str) -> None:
+    try:
+        # a second parameter for the same key renders the key ambiguous
+        index[key] = None if key in index else param_name
+    except TypeError:
+        # unhashable annotations can't be looked up anyway
+        pass
+
+
+@weakly_memoized
+def _introspect(func: Callable) -> tuple[ParameterIndex, ParameterIndex]:
+    """index `func`'s parameters by ArgumentFlag and by type annotation
+
+    The signature is scanned once, such that all subsequent lookups are
+    plain dict accesses. Duplicates are detected during this scan already.
+
+    :return: (parameter name by flag, parameter name by type)
+    """
+    flagged: ParameterIndex = {}
+    typed: ParameterIndex = {}
+    for param_name, param in _cached_signature(func).parameters.items():
+        annotation = param.annotation
+        # only Annotated[...] aliases carry __metadata__; reading it (and
+        # __origin__, the actual type) directly bypasses typing.get_args()
+        metadata = getattr(annotation, "__metadata__", None)
+        if metadata is not None:
+            _add_to_index(typed, annotation.__origin__, param_name)
+            # a flag repeated on the same parameter still flags one argument
+            flags = frozenset(m for m in metadata
+                              if isinstance(m, type)
+                              and issubclass(m, ArgumentFlag))
+            for flag in flags:
+                _add_to_index(flagged, flag, param_name)
+        elif annotation is not _EMPTY:
+            _add_to_index(typed, annotation, param_name)
+    return flagged, typed
 
 
 def get_flagged_argument(
@@ -34,28 +96,16 @@ def get_flagged_argument(
     >>> get_flagged_argument(func, IsUUTSetupData)
     'serial_no'
     """
-    matching_args = list(_parameter_with_certain_flag(func, flag))
-    if (total_matching_args := len(matching_args)) == 1:
-        return matching_args[0]
-    elif total_matching_args == 0:
+    flagged, _ = _introspect(func)
+    param_name = flagged.get(flag, _UNINDEXED)
+    if param_name is _UNINDEXED:
         logger.warning(f"{origin_of_func(func)} none of this function's "
                        f"arguments is flagged as {flag}!")
         return None
-    else:
+    elif param_name is None:
         raise RuntimeError(f"{origin_of_func(func)} flags more than one "
                            f"argument as {flag}!")
-
-
-def _get_argument_by_type(
-        func: Callable,
-        dtype: Any
-) -> Generator[str, None, None]:
-    for param_name, param in inspect.signature(func).parameters.items():
-        if param.annotation is dtype:
-            yield param_name
-        if (param.annotation is Annotated
-                and dtype in get_args(param.annotation)):
-            yield param_name
+    return param_name
 
 
 def get_argument_by_type(
@@ -67,15 +117,20 @@ def get_argument_by_type(
     >>> def func(argument: float): ...
     >>> get_argument_by_type(func, float)
     'argument'
+
+    The type of an Annotated[...] parameter is considered as well:
+    >>> def func(argument: Annotated[float, IsUUTSetupData]): ...
+    >>> get_argument_by_type(func, float)
+    'argument'
     """
-    matching_args = list(_get_argument_by_type(func, dtype))
-    if (total_matching_args := len(matching_args)) == 1:
-        return matching_args[0]
-    elif total_matching_args == 0:
+    _, typed = _introspect(func)
+    param_name = typed.get(dtype, _UNINDEXED)
+    if param_name is _UNINDEXED:
         logger.warning(f"{origin_of_func(func)} none of this function's "
                        f"parameter has a type annotation which implies, that "
                        f"it would accept a {dtype!r} object!")
         return None
-    else:
+    elif param_name is None:
         raise RuntimeError(f"{origin_of_func(func)} has more than one "
                            f"parameter typed as {dtype!r}!")
+    return param_name
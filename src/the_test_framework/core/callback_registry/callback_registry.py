@@ -1,5 +1,5 @@
 from logging import getLogger
-from typing import Generator
+from typing import Iterator
 
 from the_test_framework.core.exceptions import TestSystemIntrospectionError
 
@@ -26,18 +26,21 @@ class CallbackRegistry:
         self.uut_recovery = UUTRecoveryCallback()
         self.test_sequence = TestSequenceCallback()
         self.uut_result_handler = UUTResultHandlerCallback()
-
-    def __iter__(self) -> Generator[RegisteredCallback, None, None]:
-        yield self.system_setup
-        yield self.test_bed_preparation
-        yield self.uut_setup
-        yield self.uut_recovery
-        yield self.test_sequence
-        yield self.uut_result_handler
+        self._callbacks: tuple[RegisteredCallback, ...] = (
+            self.system_setup,
+            self.test_bed_preparation,
+            self.uut_setup,
+            self.uut_recovery,
+            self.test_sequence,
+            self.uut_result_handler,
+        )
+
+    def __iter__(self) -> Iterator[RegisteredCallback]:
+        return iter(self._callbacks)
 
     def check(self) -> None:
         """Check whether all required callbacks are registered."""
-        for callback in self:
+        for callback in self._callbacks:
             if not callback.registered:
                 msg = f"No {callback.description} callback registered!"
                 logger.warning(msg)
@@ -1,5 +1,6 @@
-from abc import ABC, abstractmethod
-from logging import getLogger
+import inspect
+
+from logging import getLogger, DEBUG
 from typing import (
     Any,
     Callable,
@@ -16,32 +17,45 @@ from .assimilation import (
 logger = getLogger(__name__)
 
 
-class RegisteredCallback(ABC):
+class RegisteredCallback:
     """Base class for framework-native callback adapters.
 
     Subclasses define the native call signature in their __call__ method.
     A foreign function is registered once; its signature is introspected and
     integrated via a translation table so internal sites can invoke the wrapper
     with native kwarg names.
+
+    The native arguments are passed on positionally, in the order given by
+    the signature of __call__, which saves building a kwargs dict per call.
+
+    Subclasses are expected to declare `__slots__ = ()`.
     """
+    __slots__ = ("registered", "_integrated_func")
+
     # a description of the callback
     description: ClassVar[str]
 
     # whether this callback must be registered
     mandatory: ClassVar[bool]
 
+    # names of the native arguments, in order of the __call__ signature
+    _native_args: ClassVar[tuple[str, ...]] = ()
+
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
         enforce_presence_of_class_attributes(
             cls, {"description": str, "mandatory": bool})
+        native_parameters = inspect.signature(cls.__call__).parameters
+        cls._native_args = tuple(native_parameters)[1:]  # skip `self`
 
     def __init__(self):
-        self._registered = False
+        # whether a foreign function has been registered
+        self.registered = False
         self._integrated_func: Callable[..., Any] | None = None
 
-
-    @abstractmethod
-    def __call__(self, *args, **kwargs): ...
+    def __call__(self, *args, **kwargs):
+        raise NotImplementedError(
+            f"{self.__class__.__name__} doesn't define its native signature!")
 
     def register(self, callback: Callable) -> None:
         """Register a single foreign function for this callback slot.
@@ -61,8 +75,9 @@ class RegisteredCallback(ABC):
         )
 
         table = create_kwargs_translation_table(self.__call__, callback)
-        self._integrated_func = assimilate_function(callback, table)
-        self._registered = True
+        self._integrated_func = assimilate_function(
+            callback, table, self._native_args)
+        self.registered = True
 
         logger.info(
             "Registered %s for %s with translation %s",
@@ -71,13 +86,10 @@ class RegisteredCallback(ABC):
             table,
         )
 
-    @property
-    def registered(self) -> bool:
-        """Whether a foreign function has been registered."""
-        return self._registered
+    def _invoke(self, *args) -> Any:
+        """Invoke the registered (integrated) function with the native args.
 
-    def _invoke(self, **kwargs) -> Any:
-        """Invoke the registered (integrated) function using native kwarg names.
+        `args` are expected in order of `_native_args`.
 
         Returns:
             The foreign function's return value, or None if nothing is registered.
@@ -88,8 +100,11 @@ class RegisteredCallback(ABC):
                 self.__class__.__name__,
             )
             return None
-        logger.debug(
-            "Invoking %s with native kwargs: %s",
-            self.__class__.__name__, kwargs
-        )
-        return self._integrated_func(**kwargs)
\ No newline at end of file
+        if logger.isEnabledFor(DEBUG):
+            logger.debug(
+                "Invoking foreign %s for %s with native kwargs: %s",
+                getattr(self._integrated_func, "__qualname__",
+                        self._integrated_func),
+                self.__class__.__name__, dict(zip(self._native_args, args))
+            )
+        return self._integrated_func(*args)
\ No newline at end of file
@@ -16,50 +16,55 @@ from .abstract_callback import RegisteredCallback
 class SystemSetupCallback(RegisteredCallback):
     description = "System Setup"
     mandatory = False
+    __slots__ = ()
 
     def __call__(self, exit_stack: ExitStack) -> Any:
-        return super()._invoke(exit_stack=exit_stack)
+        return self._invoke(exit_stack)
 
 
 class TestBedPreparationCallback(RegisteredCallback):
     description = "Test Bed Preparation"
     mandatory = False
+    __slots__ = ()
+
     def __call__(
             self,
             system_setup_data: Annotated[Any, IsSystemSetupData],
     ) -> Any:
-        return super()._invoke(system_setup_data=system_setup_data)
+        return self._invoke(system_setup_data)
 
 
 class UUTSetupCallback(RegisteredCallback):
     description = "UUT Setup"
     mandatory = False
+    __slots__ = ()
 
     def __call__(
         self,
         system_setup_data: Annotated[Any, IsSystemSetupData],
         exit_stack: ExitStack,
     ) -> Any:
-        return super()._invoke(system_setup_data=system_setup_data,
-                               exit_stack=exit_stack)
+        return self._invoke(system_setup_data, exit_stack)
 
 
 class TestSequenceCallback(RegisteredCallback):
     description = "Test Sequence"
     mandatory = True
+    __slots__ = ()
 
     def __call__(
         self,
         system_setup_data: Annotated[Any, IsSystemSetupData],
         uut_setup_data: Annotated[Any, IsUUTSetupData],
     ) -> Any:
-        return super()._invoke(system_setup_data=system_setup_data,
-                               uut_setup_data=uut_setup_data)
+        return self._invoke(system_setup_data, uut_setup_data)
 
 
 class UUTRecoveryCallback(RegisteredCallback):
     description = "UUT Recovery"
     mandatory = False
+    __slots__ = ()
+
     def __call__(
         self,
         system_setup_data: Annotated[Any, IsSystemSetupData],
@@ -67,15 +72,14 @@ class UUTRecoveryCallback(RegisteredCallback):
         test_sequence_data: Annotated[Any, IsTestSequenceData],
         test_result: TestResultInfo,
     ) -> Any:
-        return super()._invoke(system_setup_data=system_setup_data,
-                               uut_setup_data=uut_setup_data,
-                               test_sequence_data=test_sequence_data,
-                               test_result=test_result)
+        return self._invoke(system_setup_data, uut_setup_data,
+                            test_sequence_data, test_result)
 
 
 class UUTResultHandlerCallback(RegisteredCallback):
     description = "UUT Result Handler"
     mandatory = False
+    __slots__ = ()
 
     def __call__(
         self,
@@ -84,7 +88,5 @@ class UUTResultHandlerCallback(RegisteredCallback):
         test_sequence_data: Annotated[Any, IsTestSequenceData],
         test_result: TestResultInfo,
     ) -> Any:
-        return super()._invoke(system_setup_data=system_setup_data,
-                               uut_setup_data=uut_setup_data,
-                               test_sequence_data=test_sequence_data,
-                               test_result=test_result)
+        return self._invoke(system_setup_data, uut_setup_data,
+                            test_sequence_data, test_result)
@@ -1,13 +1,16 @@
 import inspect
 import functools
+import keyword
 
 
-from logging import getLogger
+from logging import getLogger, DEBUG
 from typing import (
     Any,
     Callable,
+    Iterable,
     TypeAlias,
     Mapping,
+    Sequence,
 )
 
 from the_test_framework.facilities import origin_of_func
@@ -22,6 +25,17 @@ NativeArgName: TypeAlias = str
 NativeToForeign = dict[NativeArgName, ForeignArgName]
 
 
+# parameter kinds, looked up once instead of per inspected parameter
+_VAR_POS = inspect.Parameter.VAR_POSITIONAL
+_VAR_KW = inspect.Parameter.VAR_KEYWORD
+_POS_ONLY = inspect.Parameter.POSITIONAL_ONLY
+_POS_OR_KW = inspect.Parameter.POSITIONAL_OR_KEYWORD
+_EMPTY = inspect.Parameter.empty
+
+# default of the generated functions' arguments, which tells missing ones
+_MISSING: Any = object()
+
+
 def create_kwargs_translation_table(
         native_func: Callable,
         foreign_func: Callable
@@ -43,14 +57,15 @@ def create_kwargs_translation_table(
     foreign_func_name = getattr(foreign_func, "__qualname__", foreign_func)
     native_func_name = native_func.__qualname__
 
-    foreign_wk = list(well_known_arguments(foreign_func))
+    foreign_wk = well_known_arguments(foreign_func)
     if not foreign_wk:
         logger.debug("Foreign function %s declares no well-known args; "
                      "no translation needed.", foreign_func_name)
 
-    logger.debug(f"Creating kwargs translation table for native function: "
-                 f"`{origin_of_func(native_func)}` to foreign function: "
-                 f"`{origin_of_func(foreign_func)}`")
+    if logger.isEnabledFor(DEBUG):
+        logger.debug("Creating kwargs translation table for native function: "
+                     "`%s` to foreign function: `%s`",
+                     origin_of_func(native_func), origin_of_func(foreign_func))
     for wk_arg, foreign_arg_name in foreign_wk:
         if wk_arg not in native_args:
             raise TypeError(f"{foreign_func_name} declares `{wk_arg.name}`"
@@ -58,16 +73,129 @@ def create_kwargs_translation_table(
                             f"doesn’t supply it.")
         native_arg_name = native_args[wk_arg]
         mapping[native_arg_name] = foreign_arg_name
-        logger.debug(f"kwargs translation for %s -> %s",
+        logger.debug("kwargs translation for %s -> %s",
                      native_arg_name, foreign_arg_name)
 
     logger.debug("finalized kwargs translation table: %s", mapping)
     return mapping
 
 
+def _translated_call_args(
+        foreign_parameters: Iterable[inspect.Parameter],
+        kwarg_translate_table: Mapping[NativeArgName, ForeignArgName]
+) -> list[str]:
+    """arguments of the foreign function call, spelled out as source code
+
+    Foreign parameters are passed positionally in the order of the foreign
+    signature for as long as possible. Once a parameter is not covered by the
+    translation table (as it falls back to its default value) or can't be
+    passed positionally, the remaining ones are passed by keyword.
+    """
+    foreign_to_native = {foreign_arg_name: native_arg_name
+                         for native_arg_name, foreign_arg_name
+                         in kwarg_translate_table.items()}
+    call_args: list[str] = []
+    positional = True
+    for param in foreign_parameters:
+        native_arg_name = foreign_to_native.pop(param.name, None)
+        if native_arg_name is None:
+            positional = False
+        elif positional and param.kind is _POS_OR_KW:
+            call_args.append(native_arg_name)
+        else:
+            positional = False
+            call_args.append(f"{param.name}={native_arg_name}")
+    # foreign names unknown to the signature are passed anyway, such that
+    # the foreign function itself complains about them
+    call_args.extend(f"{foreign_arg_name}={native_arg_name}"
+                     for foreign_arg_name, native_arg_name
+                     in foreign_to_native.items())
+    return call_args
+
+
+def _raise_missing_native_argument(ff_repr: str, /, **native_args: Any):
+    """raise the TypeError for the first native argument not supplied"""
+    missing = next(name for name, value in native_args.items()
+                   if value is _MISSING)
+    raise TypeError(f"Missing native kwarg `{missing}` when invoking "
+                    f"{ff_repr} (required by translation table).")
+
+
+def _compile_translation(
+        foreign_func: Callable,
+        ff_repr: str,
+        foreign_parameters: Iterable[inspect.Parameter],
+        kwarg_translate_table: Mapping[NativeArgName, ForeignArgName],
+        native_arg_names: Sequence[NativeArgName],
+) -> Callable[..., Any]:
+    """generate a function which pipes native arguments to `foreign_func`
+
+    The translation table is fixed at registration time, hence the renaming
+    of the arguments is spelled out in the source of a specialized function
+    instead of being looked up on every call. For the foreign function
+    `def foreign(k1, k2, k3): ...`, the translation
+    {"a": "k2", "b": "k3", "c": "k1"} and the native arguments ("a", "b", "c")
+    the generated function looks like:
+
+        def _assimilated_foreign_function(a=__missing, b=__missing,
+                                          c=__missing, **_):
+            if a is __missing or b is __missing or c is __missing:
+                __raise_missing(a=a, b=b, c=c)
+            return __foreign_func(c, a, b)
+
+    Native arguments are accepted positionally (in order of
+    `native_arg_names`) or by keyword. Translated arguments beyond
+    `native_arg_names` are keyword only. Native arguments which aren't
+    covered by the translation table are ignored, missing ones raise a
+    TypeError naming the argument and the foreign function.
+    """
+    if not kwarg_translate_table:
+        # nothing to translate, as the foreign function requests no native
+        # argument - there's no need to generate code for just discarding them
+        def _assimilated_foreign_function(*_, **__):
+            return foreign_func()
+        return _assimilated_foreign_function
+
+    if not all(name.isidentifier() and not keyword.iskeyword(name)
+               for name in [*native_arg_names,
+                            *kwarg_translate_table.keys(),
+                            *kwarg_translate_table.values()]):
+        raise ValueError(f"translation table for {ff_repr} contains invalid "
+                         f"argument names: {kwarg_translate_table}")
+    keyword_only_args = [native_arg_name
+                         for native_arg_name in kwarg_translate_table
+                         if native_arg_name not in native_arg_names]
+    # every argument defaults to a sentinel, such that a missing one is
+    # reported by name rather than by Python's generic TypeError
+    native_args = ", ".join(
+        [*(f"{name}=__missing" for name in native_arg_names),
+         *(["*", *(f"{name}=__missing" for name in keyword_only_args)]
+           if keyword_only_args else []),
+         "**_"])
+    missing_check = " or ".join(f"{name} is __missing"
+                                for name in kwarg_translate_table)
+    required_args = ", ".join(f"{name}={name}"
+                              for name in kwarg_translate_table)
+    call_args = ", ".join(
+        _translated_call_args(foreign_parameters, kwarg_translate_table))
+    source = (f"def _assimilated_foreign_function({native_args}):\n"
+              f"    if {missing_check}:\n"
+              f"        __raise_missing({required_args})\n"
+              f"    return __foreign_func({call_args})\n")
+    namespace: dict[str, Any] = {
+        "__foreign_func": foreign_func,
+        "__missing": _MISSING,
+        "__raise_missing": functools.partial(
+            _raise_missing_native_argument, ff_repr),
+    }
+    exec(compile(source, f"<assimilated {ff_repr}>", "exec"), namespace)
+    return namespace["_assimilated_foreign_function"]
+
+
 def assimilate_function(
         foreign_func: Callable,
-        kwarg_translate_table: Mapping[NativeArgName, ForeignArgName]
+        kwarg_translate_table: Mapping[NativeArgName, ForeignArgName],
+        native_arg_names: Sequence[NativeArgName] = (),
 ) -> Callable[..., Any]:
     """wrap `foreign_func` such that it accepts arguments via a native API.
 
@@ -98,64 +226,78 @@ def assimilate_function(
         >>> assimilated_func(a="a", b="b", c="c")
         {'k1': 'c', 'k2': 'a', 'k3': 'b'}
 
+        if the order of the native arguments is passed as well, they can
+        also be supplied positionally:
+        >>> assimilated_func = assimilate_function(
+        ...     foreign_function, translation, ("a", "b", "c"))
+        >>> assimilated_func("a", "b", "c")
+        {'k1': 'c', 'k2': 'a', 'k3': 'b'}
+
     Args:
         foreign_func (Callable): the function which shall be wrapped.
         kwarg_translate_table (Mapping[NativeArgName, ForeignArgName]):
         mapping from native arg name to foreign arg name.
+        native_arg_names (Sequence[NativeArgName]): the native arguments in
+        the order in which they may be passed positionally.
 
     Returns:
-        A callable that can be invoked with the native kwarg names.
+        A callable that can be invoked with the native arguments, either
+        positionally or by their native kwarg names.
     """
     ff_repr = origin_of_func(foreign_func)
 
     # *** SANITY CHECKS ***
     foreign_parameters = inspect.signature(foreign_func).parameters.values()
 
-    if var_pos_args := [p.name for p in foreign_parameters
-                        if p.kind is inspect.Parameter.VAR_POSITIONAL]:
+    var_pos_args: list[str] = []
+    var_keyword_args: list[str] = []
+    pos_only_args: list[str] = []
+    args_without_default_value: set[str] = set()
+
+    # classify each parameter in a single pass
+    for p in foreign_parameters:
+        kind = p.kind
+        if kind is _VAR_POS:
+            var_pos_args.append(p.name)
+        elif kind is _VAR_KW:
+            var_keyword_args.append(p.name)
+        elif kind is _POS_ONLY:
+            pos_only_args.append(p.name)
+        if p.default is _EMPTY:
+            args_without_default_value.add(p.name)
+
+    if var_pos_args:
         # VAR_POSITIONAL argument is one like `def func(*args): ...`
         # we cannot handle arbitrary arguments
         raise AssertionError(f"{ff_repr} specifies the variable positional "
                              f"argument {var_pos_args[0]!r}, which "
                              f"cannot be properly translated!")
 
-    if var_keyword_args := [p.name for p in foreign_parameters
-                          if p.kind is inspect.Parameter.VAR_KEYWORD]:
+    if var_keyword_args:
         # VAR_KEYWORD argument is one like `def func(**kwargs): ...`
         # we cannot handle arbitrary arguments
         raise AssertionError(f"{ff_repr} specifies a variable keyword "
                              f"argument {var_keyword_args[0]!r}, which cannot "
                              f"be properly translated!")
 
-    if pos_only_args := [p.name for p in foreign_parameters
-                         if p.kind is inspect.Parameter.POSITIONAL_ONLY]:
-        pos_only_args = ", ".join([repr(p) for p in pos_only_args])
+    if pos_only_args:
+        pos_only_args_repr = ", ".join([repr(p) for p in pos_only_args])
         raise AssertionError(f"{ff_repr} specifies positional only arguments "
-                             f"({pos_only_args}), which cannot handled by "
+                             f"({pos_only_args_repr}), which cannot handled by "
                              f"the current implementation!")
 
     args_covered_by_native_api = set(kwarg_translate_table.values())
-    args_without_default_value = {p.name for p in foreign_parameters
-                            if p.default is inspect._empty}
     if orphaned_args := args_without_default_value - args_covered_by_native_api:
         raise AssertionError(f"{ff_repr} specified {", ".join(orphaned_args)} "
                              "arguments which aren't provided via the native "
                              "API!")
 
-    @functools.wraps(foreign_func)
-    def _assimilated_foreign_function(**kwargs):
-        # pipe native kwarg names to the ones of foreign function
-        foreign_kwargs: dict[str, Any] = {}
-        for native_arg_name, foreign_arg_name in kwarg_translate_table.items():
-            if native_arg_name not in kwargs:
-                raise TypeError(f"Missing native kwarg `{native_arg_name}` "
-                                f"when invoking {ff_repr} (required by "
-                                f"translation table).")
-            foreign_kwargs[foreign_arg_name] = kwargs[native_arg_name]
-        logger.debug("Invoking foreign %s with kwargs: %s",
-                     ff_repr, foreign_kwargs)
-        return foreign_func(**foreign_kwargs)
+    _assimilated_foreign_function = functools.wraps(foreign_func)(
+        _compile_translation(foreign_func, ff_repr, foreign_parameters,
+                             kwarg_translate_table, native_arg_names))
+    # invocations aren't logged here - callers guard that per call, such that
+    # it follows the logger's level at the time of the call
 
     logger.debug("Integrated foreign function %s with translation table: %s",
                  ff_repr, kwarg_translate_table)
-    return _assimilated_foreign_function
\ No newline at end of file
+    return _assimilated_foreign_function
@@ -1,10 +1,8 @@
 import enum
+import functools
 
 from contextlib import ExitStack
-from typing import (
-    Callable,
-    Generator,
-)
+from typing import Callable
 
 from the_test_framework.core.arg_flags import (
     get_flagged_argument,
@@ -14,6 +12,7 @@ from the_test_framework.core.arg_flags import (
     IsTestSequenceData,
 )
 from the_test_framework.core.dtypes import TestResultInfo
+from the_test_framework.facilities import weakly_memoized
 
 
 class WellKnownArgument(enum.Enum):
@@ -30,9 +29,26 @@ class WellKnownArgument(enum.Enum):
     test_result = enum.auto()
 
 
+# how each WellKnownArgument is detected in a function's signature
+_WELL_KNOWN_ARGUMENT_PROBES: tuple[
+    tuple[WellKnownArgument, Callable[[Callable], str | None]], ...] = (
+    (WellKnownArgument.exit_stack,
+     functools.partial(get_argument_by_type, dtype=ExitStack)),
+    (WellKnownArgument.system_setup_data,
+     functools.partial(get_flagged_argument, flag=IsSystemSetupData)),
+    (WellKnownArgument.uut_setup_data,
+     functools.partial(get_flagged_argument, flag=IsUUTSetupData)),
+    (WellKnownArgument.test_sequence_data,
+     functools.partial(get_flagged_argument, flag=IsTestSequenceData)),
+    (WellKnownArgument.test_result,
+     functools.partial(get_argument_by_type, dtype=TestResultInfo)),
+)
+
+
+@weakly_memoized
 def well_known_arguments(
         func: Callable
-) -> Generator[tuple[WellKnownArgument, str], None, None]:
+) -> tuple[tuple[WellKnownArgument, str], ...]:
     """Get WellKnownArguments and corresponding names from `func`s signature.
 
     A function 'declares' a well-known argument if:
@@ -46,24 +62,10 @@ def well_known_arguments(
     matches the same WellKnownArgument. Like, when two arguments are typed as
     ExitStack or are annotated with the same ArgumentFlag
     (e.g. Annotated[..., IsSystemSetupData]).
-    :return: yields (WellKnownArgument, name of the argument)
+    :return: (WellKnownArgument, name of the argument) pairs
     """
-    exit_stack_arg_name = get_argument_by_type(func, ExitStack)
-    if exit_stack_arg_name is not None:
-        yield WellKnownArgument.exit_stack, exit_stack_arg_name
-
-    system_setup_arg_name = get_flagged_argument(func, IsSystemSetupData)
-    if system_setup_arg_name is not None:
-        yield WellKnownArgument.system_setup_data, system_setup_arg_name
-
-    uut_setup_arg_name = get_flagged_argument(func, IsUUTSetupData)
-    if uut_setup_arg_name is not None:
-        yield WellKnownArgument.uut_setup_data, uut_setup_arg_name
-
-    test_sequence_arg_name = get_flagged_argument(func, IsTestSequenceData)
-    if test_sequence_arg_name is not None:
-        yield WellKnownArgument.test_sequence_data, test_sequence_arg_name
-
-    test_result_arg_name = get_argument_by_type(func, TestResultInfo)
-    if test_result_arg_name is not None:
-        yield WellKnownArgument.test_result, test_result_arg_name
+    arguments: list[tuple[WellKnownArgument, str]] = []
+    for wk_arg, probe in _WELL_KNOWN_ARGUMENT_PROBES:
+        if (arg_name := probe(func)) is not None:
+            arguments.append((wk_arg, arg_name))
+    return tuple(arguments)
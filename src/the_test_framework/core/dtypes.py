@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 import enum
 from types import TracebackType
-from typing import Any, TypeAlias
+from typing import Any, Sequence, TypeAlias
 from logging import LogRecord
 
 
@@ -16,7 +16,10 @@ class ExcInfo:
 
 
 class TestResult(enum.Enum):
-    """The Test Result of both Test Step and Test Sequence"""
+    """The Test Result of both Test Step and Test Sequence
+
+    Members are declared in order of their merging precedence.
+    """
     SUCCESS = enum.auto()
     FAILED = enum.auto()
     EXCEPTION = enum.auto()
@@ -33,18 +36,7 @@ class TestResult(enum.Enum):
         """
         if not isinstance(other, TestResult):
             raise TypeError(f"Expected TestResult but got {type(other)}")
-        this_precedence_index = TestResultMergingPrecedence.index(self)
-        other_precedence_index = TestResultMergingPrecedence.index(other)
-        winning_precedence_index = max(this_precedence_index, other_precedence_index)
-        winning_precedence = TestResultMergingPrecedence[winning_precedence_index]
-        return TestResult(winning_precedence.value)
-
-
-TestResultMergingPrecedence = [
-    TestResult.SUCCESS,
-    TestResult.FAILED,
-    TestResult.EXCEPTION,
-]
+        return self if self.value >= other.value else other
 
 
 @dataclass
@@ -67,7 +59,7 @@ class TestStepResultInfo[T]:
     uuid: TestStepCallID
     returned: T
     log: list[LogRecord]
-    embedded_results: list["TestStepResultInfo"]
+    embedded_results: Sequence["TestStepResultInfo"]
     exception: BaseException | None = None
 
     def __bool__(self) -> bool:
@@ -76,8 +68,33 @@ class TestStepResultInfo[T]:
 
 @dataclass
 class TestResultInfo:
-    """Captures the Result for a Test Sequence"""
+    """Captures the Result for a Test Sequence
+
+    The merged result of all steps is maintained as steps are added via
+    append(). Call recompute() after mutating `steps` directly.
+    """
     steps: list[TestStepResultInfo[Any]]
+    _result: TestResult = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.recompute()
+
+    def append(self, step: TestStepResultInfo[Any]) -> None:
+        """add the result of another step to the Test Sequence"""
+        self.steps.append(step)
+        self._result = self._result.merge(step.result)
+
+    def recompute(self) -> None:
+        """merge the results of all steps anew"""
+        result = TestResult.SUCCESS
+        for step in self.steps:
+            result = result.merge(step.result)
+        self._result = result
+
+    @property
+    def result(self) -> TestResult:
+        """the merged result of all steps"""
+        return self._result
 
     def __bool__(self) -> bool:
-        return all(self.steps)
+        return self._result is TestResult.SUCCESS
@@ -7,25 +7,49 @@ from contextlib import contextmanager
 from dataclasses import dataclass
 from logging import getLogger
 from multiprocessing import Process
-from threading import Thread
+from multiprocessing.connection import wait
+from threading import Thread, Event
 from typing import Callable, Any
 
 logger = getLogger(__name__)
 
 
-@dataclass
+# the monitor loop re-checks the tasks at least this often (in seconds), even
+# if nothing woke it up
+BACKSTOP_INTERVAL = 60.0
+
+# tasks which are added before being started are checked this often until
+# they are (as the monitor loop used to poll all tasks)
+TASK_START_POLL_INTERVAL = 1.0
+
+# owners usually remove a task right after it ended - a terminated task is
+# only reported, if it's still registered after this many seconds
+TASK_GRACE_PERIOD = 0.5
+
+
+@dataclass(slots=True)
 class MonitorError:
     origin: str
     message: str
     exception: Exception | None = None
 
 
+@dataclass(slots=True)
+class _ScheduledCallback:
+    on_error_callback: Callable[[], Any] | None
+    interval: float
+    due: float
+
+
 class TestSystemMonitor:
     def __init__(self):
-        self._callbacks = {}
-        self._tasks = []
+        self._callbacks: dict[Callable[[], bool], _ScheduledCallback] = {}
+        # supervised tasks by their id()
+        self._tasks: dict[int, Thread | Process] = {}
         self._monitor_is_running = False
         self._error: list[MonitorError] = []
+        # set whenever the monitor loop has to look at the system's state
+        self._wakeup = Event()
 
     def set_error(self, origin: str, message: str, exception: Exception | None = None) -> None:
         logger.exception(f"{origin!r} reports {message!r} ({exception!r})", exc_info=exception)
@@ -39,25 +63,59 @@ class TestSystemMonitor:
     def errors(self):
         return self._error
 
-    def add_monitor_callback(self, callback: Callable[[], bool], on_error_callback: Callable[[], Any] | None = None) -> None:
+    def add_monitor_callback(self, callback: Callable[[], bool], on_error_callback: Callable[[], Any] | None = None, interval: float = 1.0) -> None:
         """
         Add a monitor callback which asserts the system's state.
         :param callback:
         :param on_error_callback: a callback which is executed when callback returns False.
+        :param interval: seconds between two invocations of callback.
         :return:
         """
-        self._callbacks[callback] = on_error_callback
+        self._callbacks[callback] = _ScheduledCallback(
+            on_error_callback, interval, time.monotonic() + interval)
+        # let the monitor loop take the new schedule into account
+        self._wakeup.set()
 
     def remove_monitor_callback(self, callback: Callable[[], bool]):
         self._callbacks.pop(callback)
 
     def add_task(self, task: Thread | Process):
         logger.debug(f"adding task {task.name}")
-        self._tasks.append(task)
+        self._tasks[id(task)] = task
+        Thread(target=self._await_termination, args=(task,),
+               name=f"monitor watching {task.name}", daemon=True).start()
+
+    def _is_registered(self, task: Thread | Process) -> bool:
+        return self._tasks.get(id(task)) is task
+
+    @staticmethod
+    def _is_started(task: Thread | Process) -> bool:
+        if isinstance(task, Process):
+            return task.pid is not None
+        return task.ident is not None
+
+    def _await_termination(self, task: Thread | Process):
+        """block until `task` terminated, then wake up the monitor loop"""
+        while not self._is_started(task):
+            time.sleep(TASK_START_POLL_INTERVAL)
+            if not self._is_registered(task):
+                return
+            if not self._is_started(task):
+                # the monitor loop reports a task, which isn't alive
+                self._wakeup.set()
+        if isinstance(task, Process):
+            # the sentinel becomes ready as soon as the process exits,
+            # without reaping it behind its owner's back
+            wait([task.sentinel])
+        else:
+            task.join()
+        time.sleep(TASK_GRACE_PERIOD)
+        if self._is_registered(task):
+            self._wakeup.set()
 
     def remove_task(self, task: Thread | Process):
         logger.debug(f"Removing task {task.name}")
-        self._tasks.remove(task)
+        self._tasks.pop(id(task), None)
 
     @contextmanager
     def task(self,  task: Thread | Process):
@@ -66,34 +124,49 @@ class TestSystemMonitor:
         self.remove_task(task)
 
     @contextmanager
-    def monitor(self, callback: Callable[[], bool], on_error_callback: Callable[[], Any]):
-        self.add_monitor_callback(callback, on_error_callback)
+    def monitor(self, callback: Callable[[], bool], on_error_callback: Callable[[], Any], interval: float = 1.0):
+        self.add_monitor_callback(callback, on_error_callback, interval)
         yield
         self.remove_monitor_callback(callback)
 
     def quit(self):
         self._monitor_is_running = False
+        self._wakeup.set()
 
     def monitor_loop(self):
+        """
+        Check the monitor callbacks as scheduled and the tasks whenever one
+        of them terminates.
+
+        Between two checks the loop blocks until the next callback is due,
+        a task terminated, or quit() is called.
+        """
         self._monitor_is_running = True
         while self._monitor_is_running:
-            time.sleep(1)
-            for callback, on_error_callback in self._callbacks.items():
+            self._wakeup.clear()
+            now = time.monotonic()
+            for callback, scheduled in tuple(self._callbacks.items()):
+                if scheduled.due > now:
+                    continue
+                scheduled.due = now + scheduled.interval
                 if not callback():
                     logger.critical("shit hit the fan!")
-                    if on_error_callback is not None:
-                        on_error_callback()
-            for task in self._tasks:
+                    if scheduled.on_error_callback is not None:
+                        scheduled.on_error_callback()
+            for task in tuple(self._tasks.values()):
                 if isinstance(task, Process):
                     name = task.name
                     pid = task.pid
                     if task.is_alive():
-                        logger.log(0, f"Process {name} (PID: {pid}) seem to be alive!")
+                        logger.log(0, "Process %s (PID: %s) seem to be alive!", name, pid)
                     else:
                         exit_code = task.exitcode
                         self.set_error(threading.current_thread().name, f"{name} (PID: {pid}) seem to be dead! (exit code: {exit_code})")
                 else:
                     if task.is_alive():
-                        logger.log(0, f"Task {task.name!r} seem to be alive!")
+                        logger.log(0, "Task %r seem to be alive!", task.name)
                     else:
                         self.set_error(threading.current_thread().name, f"{task.name} seem to be dead!")
+            next_due = min((s.due for s in self._callbacks.values()),
+                           default=now + BACKSTOP_INTERVAL)
+            self._wakeup.wait(max(next_due - time.monotonic(), 0))
@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import functools
-
 from typing import Any, TYPE_CHECKING
 
 from log_capture import LogCapture
@@ -21,20 +19,19 @@ class TestSequenceSupervision:
     @classmethod
     def setup_supervision(
             cls,
-            log_capture: LogCapture | None = None
+            log_capture: LogCapture | None = None,
+            max_log_records: int | None = None,
     ) -> tuple[TestSequenceSupervision, TestStepSupervisor]:
-        """creates entangled TestStepSupervision and TestStepSupervisor"""
-        sequence_supervision = cls()
-
-        def submit_test_step_meta_data(metadata: TestStepMetadata):
-            """submit new TestStepMetadata to SequenceSupervision"""
-            if metadata.parent is not None:
-                return
-            sequence_supervision._sequence.append(metadata)
+        """creates entangled TestStepSupervision and TestStepSupervisor
 
+        :param max_log_records: retain only this many of the most recent log
+            records per TestStep (None retains all of them)
+        """
+        sequence_supervision = cls()
         step_supervisor = TestStepSupervisor(
-            on_test_step_enter_callback=submit_test_step_meta_data,
+            on_test_step_enter_callback=sequence_supervision._on_test_step_enter,
             log_capture=log_capture,
+            max_log_records=max_log_records,
         )
         return sequence_supervision, step_supervisor
 
@@ -51,6 +48,18 @@ class TestSequenceSupervision:
         # whether context was traversed
         self._traversed_context = False
 
+        # the test result, once it was computed
+        self._cached_test_result: TestResult | None = None
+
+    def _on_test_step_enter(self, metadata: TestStepMetadata):
+        """submit new TestStepMetadata to SequenceSupervision
+
+        Only top level TestSteps are part of the sequence, embedded ones are
+        tracked by their parent's TestStepMetadata.
+        """
+        if metadata._parent_step is None:
+            self._sequence.append(metadata)
+
     def __enter__(self):
         return self
 
@@ -60,6 +69,7 @@ class TestSequenceSupervision:
     def submit_return_value(self, return_value: Any):
         self._return_value = return_value
         self._submitted_return_value = True
+        self._cached_test_result = None
 
     @property
     def test_result(self) -> TestResult:
@@ -68,17 +78,19 @@ class TestSequenceSupervision:
             raise RuntimeError("Test Sequence not yet finished!")
         if not self._submitted_return_value:
             raise RuntimeError("return value of Test Sequence is not yet submitted!")
+        if self._cached_test_result is not None:
+            return self._cached_test_result
 
-        sequence_results = [t.test_result for t in self._sequence]
-        inferred_result = infer_test_result(self._return_value)
-
-        return functools.reduce(lambda a, b: a.merge(b),
-                                [*sequence_results, inferred_result])
+        test_result = infer_test_result(self._return_value)
+        for test_step in self._sequence:
+            test_result = test_result.merge(test_step.test_result)
+        self._cached_test_result = test_result
+        return test_result
 
     @property
     def test_result_info(self) -> TestResultInfo:
         return TestResultInfo(steps=[ts.as_test_step_result_info()
-                                     for ts in self.metadata])
+                                     for ts in self._sequence])
 
     @property
     def return_value(self) -> Any:
@@ -1,4 +1,4 @@
-import functools
+import itertools
 from dataclasses import dataclass
 
 from . import TestResult
@@ -11,5 +11,8 @@ class TestSequenceReport:
 
     @property
     def test_result(self) -> TestResult:
-        return functools.reduce(lambda a, b: a.merge(b),
-                                [s.test_result for s in self.steps])
+        # computed on each access, as `steps` may still be extended
+        test_result = self.steps[0].test_result
+        for step in itertools.islice(self.steps, 1, None):
+            test_result = test_result.merge(step.test_result)
+        return test_result
@@ -26,10 +26,12 @@ R_E = TypeVar("R_E")
 logger = getLogger(__name__)
 
 
-class _DataTypeWhichWontBeReturnedByAnyTestStep: ...
+# placeholder for the return value of a TestStep which didn't return (yet)
+_UNSET: Any = object()
 
 
 class DecoratedTestStep(Generic[P, R]):
+    __slots__ = ("_f", "name", "abort_on_error", "_repr")
     name: str
 
     def __init__(
@@ -41,26 +43,31 @@ class DecoratedTestStep(Generic[P, R]):
         self._f = f
         self.name = name
         self.abort_on_error = abort_on_error
+        self._repr = f"<TestStep {name!r}>"
 
     def __repr__(self):
-        return f"<TestStep {self.name!r}>"
+        return self._repr
 
     def _call_as_part_of_a_test_system(self,
                                        test_system: TestSystem,
                                        *args: P.args, **kwargs: P.kwargs) -> R:
-        returned = _DataTypeWhichWontBeReturnedByAnyTestStep()
+        returned = _UNSET
+        test_step_supervisor = test_system.test_step_supervisor
+        repeat_test_step = test_system.repeat_test_step
+        f = self._f
+        supervision = test_step_supervisor.supervise_test_step(self)
         while True:
-            supervision = test_system.test_step_supervisor.supervise_test_step(self)
             try:
-                logger.info(f"executing {self}")
+                logger.info("executing %s", self)
                 with supervision:
-                    returned = self._f(*args, **kwargs)
+                    returned = f(*args, **kwargs)
                 supervision.submit_return_value(returned)
-                logger.debug(f"{self} completed")
+                logger.debug("%s completed", self)
             except Exception as e:
-                logger.exception(f"{self} failed with exception!", exc_info=e)
+                logger.exception("%s failed with exception!", self, exc_info=e)
 
-            if test_system.repeat_test_step(self):
+            if repeat_test_step(self):
+                test_step_supervisor.resupervise_test_step(supervision)
                 continue
 
             result = supervision.metadata.test_result
@@ -70,7 +77,7 @@ class DecoratedTestStep(Generic[P, R]):
                         f"Aborting test sequence since {self} failed! "
                         f"(result: {result!r}")
 
-            if isinstance(returned, _DataTypeWhichWontBeReturnedByAnyTestStep):
+            if returned is _UNSET:
                 # calming pyright, which would otherwise claim, that returned
                 # type is the union of its original type and None
                 raise AssertionError("Hinerk obviously isn't as good at his "
@@ -81,8 +88,8 @@ class DecoratedTestStep(Generic[P, R]):
         try:
             test_system = TestSystem.get_active_instance()
         except NoTestSystemInstanceFound:
-            logger.info(f"No instance of TestSystem found! Calling "
-                        f"{self.name} outside of TestSystem scope!")
+            logger.info("No instance of TestSystem found! Calling %s "
+                        "outside of TestSystem scope!", self.name)
             return self._f(*args, **kwargs)
         else:
             return self._call_as_part_of_a_test_system(test_system, *args, **kwargs)
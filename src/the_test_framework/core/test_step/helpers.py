@@ -9,10 +9,13 @@ from ..exceptions import FailedTest
 def infer_test_result(returned: Any | None = None,
                       exc_info: BaseException | None = None) -> TestResult:
     """infers test result from return value or exception info"""
-    if isinstance(returned, TestResult):
-        return returned
-    if isinstance(returned, CustomTestResult):
-        return returned.result
+    # most test steps return None, which bypasses the type checks altogether
+    if returned is not None:
+        # TestResult has members, hence can't be subclassed
+        if type(returned) is TestResult:
+            return returned
+        if isinstance(returned, CustomTestResult):
+            return returned.result
     if exc_info is not None:
         if isinstance(exc_info, FailedTest):
             return TestResult.FAILED
@@ -1,23 +1,21 @@
 from __future__ import annotations
 
 import datetime
-import functools
-import uuid
-from dataclasses import dataclass
+import os
+import sys
 from logging import LogRecord
 from types import TracebackType
-from typing import Callable, Any, Iterator, TYPE_CHECKING
+from typing import Any, Iterator, TYPE_CHECKING
 
 
 from .helpers import infer_test_result
-from ..dtypes import ExcInfo, TestStepResultInfo, TestResult
+from ..dtypes import ExcInfo, TestStepResultInfo, TestResult, TestStepCallID
 from ..test_step_report import TestStepReport
 
 if TYPE_CHECKING:
     from .decorated_test_step import DecoratedTestStep
 
 
-@dataclass
 class TestStepMetadataControl:
     """helper class used to sneak a TestSteps return value and potential
     exception info into its associated TestStepMetadata object
@@ -25,7 +23,8 @@ class TestStepMetadataControl:
     TestStepMetadata is partially set up before, and finalized after the
     execution of the TestStep. TestStepMetadataControl bundles the required
     methods to complete a TestStepMetadata object after a TestSteps execution
-    finished.
+    finished. It merely holds a reference to the TestStepMetadata object and
+    delegates to its hidden API.
 
     > Why not maintain a PreTestStepMetadata and PostTestStepMetadata?
     TestStepMetadata contains references to a parent (in case the TestStep is
@@ -51,17 +50,55 @@ class TestStepMetadataControl:
     inside a class method (see: TestStepMetadata.create_controlled_metadata)
     of its own kind is yet to be discussed ;-).
     """
-    submit_return_value: Callable[[Any], None]
-    submit_exception_info: Callable[
-        [type[BaseException], BaseException, TracebackType], None]
-    submit_log_messages:Callable[[list[LogRecord]], None]
-    submit_test_start_time: Callable[[datetime.datetime], None]
-    submit_test_end_time: Callable[[datetime.datetime], None]
-    complete: Callable[[], None]
+    __slots__ = ("_metadata",)
+
+    def __init__(self, metadata: TestStepMetadata):
+        self._metadata = metadata
+
+    def submit_return_value(self, returned: Any) -> None:
+        self._metadata._submit_return_value(returned)
+
+    def submit_exception_info(self,
+                              exc_type: type[BaseException],
+                              exc_val: BaseException,
+                              exc_tb: TracebackType) -> None:
+        self._metadata._submit_exception_info(exc_type, exc_val, exc_tb)
+
+    def submit_log_messages(self, messages: list[LogRecord]) -> None:
+        self._metadata._submit_log_messages(messages)
+
+    def submit_test_start_time(self, ts: datetime.datetime) -> None:
+        self._metadata._submit_start_time(ts)
+
+    def submit_test_end_time(self, ts: datetime.datetime) -> None:
+        self._metadata._submit_end_time(ts)
+
+    def complete(self) -> None:
+        self._metadata._set_completed()
 
 
 class TestStepMetadata:
     """Data Structure for TestStep Metadata"""
+    __slots__ = (
+        "_call_id",
+        "test_step",
+        "_parent_step",
+        "_ancestors",
+        "_full_name",
+        "_exc_info",
+        "_log_messages",
+        "_return_value",
+        "_return_value_is_set",
+        "_test_start_time",
+        "_test_end_time",
+        "_embedded_steps",
+        "_completed",
+        "_cached_test_result",
+        "_repr",
+        "_result_info_cache",
+        "__weakref__",
+    )
+
     @classmethod
     def create_controlled_metadata(
             cls,
@@ -77,15 +114,9 @@ class TestStepMetadata:
         :param parent: parent TestStepMetadata
         """
         metadata = cls(function=function, parent=parent)
-        control = TestStepMetadataControl(
-            submit_return_value=metadata._submit_return_value,
-            submit_exception_info=metadata._submit_exception_info,
-            submit_log_messages=metadata._submit_log_messages,
-            submit_test_start_time=metadata._submit_start_time,
-            submit_test_end_time=metadata._submit_end_time,
-            complete=metadata._set_completed)
+        control = TestStepMetadataControl(metadata)
         if parent is not None:
-            parent.children.append(metadata)
+            parent._embedded_steps.append(metadata)
         return metadata, control
 
     def __init__(
@@ -101,9 +132,16 @@ class TestStepMetadata:
         :param function: the TestStep function
         :param parent: Optional TestStepMetadata of the parent TestStep
         """
-        self._call_id = uuid.uuid4()
+        # 128 random bits, rendered as hex just like UUID.hex
+        self._call_id: TestStepCallID = os.urandom(16).hex()
         self.test_step = function
         self._parent_step = parent
+        # the ancestry is fixed by the parent, from the closest to the root
+        self._ancestors: tuple[TestStepMetadata, ...] = (
+            () if parent is None else (parent, *parent._ancestors))
+        # names of the ancestry, joined from the root down to this TestStep
+        self._full_name: str = (function.name if parent is None
+                                else f"{parent._full_name}>{function.name}")
 
         self._exc_info: ExcInfo | None = None
         self._log_messages: list[LogRecord] | None = None
@@ -116,9 +154,19 @@ class TestStepMetadata:
 
         self._completed = False
 
+        # the test result is final once the step completed, hence computed once
+        self._cached_test_result: TestResult | None = None
+
+        # the representation only depends on the (fixed) full name
+        self._repr: str | None = None
+
+        # rendered once the step completed, see as_test_step_result_info()
+        self._result_info_cache: TestStepResultInfo | None = None
+
     def __repr__(self) -> str:
-        name = ">".join([ts.name for ts in [*self.ancestors(), self]])
-        return f"<TestStepMetadata {name!r}>"
+        if self._repr is None:
+            self._repr = f"<TestStepMetadata {self._full_name!r}>"
+        return self._repr
 
     def __hash__(self) -> int:
         return hash(self._call_id)
@@ -160,6 +208,11 @@ class TestStepMetadata:
         """name of the TestStep"""
         return self.test_step.name
 
+    @property
+    def full_name(self) -> str:
+        """names of all TestSteps from the root down to this one, joined by '>'"""
+        return self._full_name
+
     @property
     def children(self) -> list[TestStepMetadata]:
         """TestStepMetadata of embedded TestSteps"""
@@ -240,24 +293,28 @@ class TestStepMetadata:
         if not self.completed:
             raise RuntimeError(f"test step {self!r} "
                                f"has not completed yet!")
+        if self._cached_test_result is not None:
+            return self._cached_test_result
         inferred_test_result = infer_test_result(
             returned=self._return_value,
             exc_info=None if self._exc_info is None else self._exc_info.instance)
-        embedded_results = {t.test_result for t in self._embedded_steps}
-        return functools.reduce(
-            lambda a, b: a.merge(b), [*embedded_results, inferred_test_result])
+        test_result = inferred_test_result
+        for embedded_step in self._embedded_steps:
+            test_result = test_result.merge(embedded_step.test_result)
+        self._cached_test_result = test_result
+        return test_result
 
     def ancestors(self) -> Iterator[TestStepMetadata]:
         """Iterate this TestSteps Ancestors"""
-        if self.parent is not None:
-            yield self.parent
-            yield from self.parent.ancestors()
+        return iter(self._ancestors)
 
     def descendants(self) -> Iterator[TestStepMetadata]:
-        """iterate over this TestSteps descendants"""
-        for child in self.children:
-            yield child
-            yield from child.descendants()
+        """iterate over this TestSteps descendants (depth-first)"""
+        stack = self._embedded_steps[::-1]
+        while stack:
+            descendant = stack.pop()
+            yield descendant
+            stack.extend(reversed(descendant._embedded_steps))
 
     def as_test_step_result_info(self) -> TestStepResultInfo:
         """render Metadata as TestStepResultInfo
@@ -265,20 +322,35 @@ class TestStepMetadata:
         :raises RuntimeError: if TestStep execution is not yet completed.
         In doubt, check self.completed before calling as_test_step_result_info().
         """
-        return TestStepResultInfo(
-            name=self.name,
-            result=self.test_result,
-            returned=self.return_value,
-            uuid=self._call_id.hex,
-            log=self.log_messages,
-            embedded_results=[e.as_test_step_result_info() for e in self.children],
-            exception=None if self.exc_info is None else self.exc_info.instance,
-        )
+        if self._result_info_cache is not None:
+            return self._result_info_cache
+        # render the tree post-order without recursion: each step is rendered
+        # once all of its embedded steps have been rendered (and cached)
+        stack: list[tuple[TestStepMetadata, bool]] = [(self, False)]
+        while stack:
+            step, embedded_steps_rendered = stack.pop()
+            if step._result_info_cache is not None:
+                continue
+            if not embedded_steps_rendered:
+                stack.append((step, True))
+                stack.extend([(e, False) for e in step._embedded_steps])
+                continue
+            step._result_info_cache = TestStepResultInfo(
+                name=step.name,
+                result=step.test_result,
+                returned=step.return_value,
+                uuid=step._call_id,
+                log=step.log_messages,
+                embedded_results=tuple([e._result_info_cache
+                                        for e in step._embedded_steps]),
+                exception=None if step.exc_info is None else step.exc_info.instance,
+            )
+        return self._result_info_cache
 
     def as_dict(self):
         return dict(
             name=self.name,
-            children=[c.as_dict() for c in self.children],
+            children=[c.as_dict() for c in self._embedded_steps],
             start_time=self.start_time,
             end_time=self.end_time,
             test_result=self.test_result,
@@ -289,13 +361,15 @@ class TestStepMetadata:
 
     def as_test_step_report(self) -> TestStepReport:
         return TestStepReport(
-            name=self.name,
+            # the same TestSteps are reported over and over again (UUT by UUT)
+            name=sys.intern(self.name),
             test_result=self.test_result,
             start_time=self.start_time,
             end_time=self.end_time,
             log_messages=self.log_messages,
-            children=[c.as_test_step_report() for c in self.children],
-            parent=None if self.parent is None else self.parent.as_test_step_report(),
+            children=tuple([c.as_test_step_report()
+                            for c in self._embedded_steps]),
+            parent=None if self._parent_step is None else self._parent_step.as_test_step_report(),
             return_value=self.return_value,
             exc_info=self.exc_info,
         )
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import datetime
+import weakref
 from typing import Callable, Any, TYPE_CHECKING
 from log_capture import LogCapture
 
@@ -19,10 +20,19 @@ class TestStepSupervision:
             log_capture: LogCapture,
             metadata: TestStepMetadata,
             metadata_ctrl: TestStepMetadataControl,
-            on_enter_callback: Callable[[], None],
-            on_exit_callback: Callable[[], None],
+            on_enter_callback: Callable[[TestStepMetadata], None],
+            on_exit_callback: Callable[[TestStepMetadata], None],
+            max_log_records: int | None = None,
     ):
+        """
+        :param on_enter_callback: called on entering the context, with the
+            metadata of the current attempt
+        :param on_exit_callback: called on leaving the context, likewise
+        :param max_log_records: retain only this many of the most recent log
+            records of the TestStep (None retains all of them)
+        """
         self._log_capture = log_capture
+        self._max_log_records = max_log_records
         self._metadata = metadata
         self._metadata_ctrl = metadata_ctrl
         self._on_enter_callback = on_enter_callback
@@ -33,7 +43,7 @@ class TestStepSupervision:
 
     def __enter__(self):
         self._log_capture.__enter__()
-        self._on_enter_callback()
+        self._on_enter_callback(self._metadata)
         self._metadata_ctrl.submit_test_start_time(
             datetime.datetime.now().astimezone())
         return self
@@ -44,9 +54,13 @@ class TestStepSupervision:
         self._log_capture.__exit__(exc_type, exc_val, exc_tb)
         self._traversed_context = True
         self._metadata_ctrl.submit_exception_info(exc_type, exc_val, exc_tb)
-        self._metadata_ctrl.submit_log_messages(self._log_capture.records)
+        records = self._log_capture.records
+        if (self._max_log_records is not None
+                and len(records) > self._max_log_records):
+            records = records[-self._max_log_records:]
+        self._metadata_ctrl.submit_log_messages(records)
         self._attempt_to_complete()
-        self._on_exit_callback()
+        self._on_exit_callback(self._metadata)
 
     def _attempt_to_complete(self):
         """completes associated TestStepMetadata object if precondition is met
@@ -57,6 +71,24 @@ class TestStepSupervision:
         if self._submitted_return_value and self._traversed_context:
             self._metadata_ctrl.complete()
 
+    def _begin_new_attempt(
+            self,
+            log_capture: LogCapture,
+            metadata: TestStepMetadata,
+            metadata_ctrl: TestStepMetadataControl,
+    ):
+        """reset supervision for repeating the TestStep
+
+        :param log_capture: capture for the log messages of the new attempt
+        :param metadata: TestStepMetadata of the new attempt
+        :param metadata_ctrl: TestStepMetadataControl of the new attempt
+        """
+        self._log_capture = log_capture
+        self._metadata = metadata
+        self._metadata_ctrl = metadata_ctrl
+        self._traversed_context = False
+        self._submitted_return_value = False
+
     def submit_return_value(self, return_value: Any):
         """submit the return value of the call of the supervised TestStep"""
         self._metadata_ctrl.submit_return_value(return_value)
@@ -78,14 +110,23 @@ class TestStepSupervisor:
             on_test_step_exit_callback: Callable[[
                 TestStepMetadata], None] | None = None,
             log_capture: LogCapture | None = None,
+            max_log_records: int | None = None,
     ):
+        """
+        :param max_log_records: retain only this many of the most recent log
+            records per TestStep (None retains all of them)
+        """
         self._on_test_step_enter_callback = on_test_step_enter_callback
         self._on_test_step_exit_callback = on_test_step_exit_callback
 
         self._log_capture = LogCapture() if log_capture is None else log_capture
+        self._max_log_records = max_log_records
         self._test_step_stack: list[TestStepMetadata] = list()
-        self._supervision_registry: dict[
-            TestStepMetadata, TestStepSupervision] = dict()
+        # supervisions of TestSteps which are still being executed; entries
+        # vanish along with their supervision (once the TestStep returned), so
+        # the registry doesn't pin every TestStep ever executed in memory
+        self._supervision_registry: weakref.WeakValueDictionary[
+            TestStepMetadata, TestStepSupervision] = weakref.WeakValueDictionary()
 
         # TestStepMetadata for the most recently finished TestStep:
         self._latest_test_step: TestStepMetadata | None = None
@@ -110,29 +151,49 @@ class TestStepSupervisor:
             parent=self.active_test_step,
             function=test_step)
 
-        def on_test_step_enter_callback():
-            self._test_step_stack.append(metadata)
-            if self._on_test_step_enter_callback is not None:
-                self._on_test_step_enter_callback(metadata)
-
-        def on_test_step_exit_callback():
-            assert self._test_step_stack[-1] == metadata
-            self._latest_test_step = self._test_step_stack.pop()
-            if len(self._test_step_stack) == 0:
-                self._latest_root_test_step = self._latest_test_step
-            if self._on_test_step_exit_callback is not None:
-                self._on_test_step_exit_callback(metadata)
-
         test_step_supervision = TestStepSupervision(
             log_capture=self._log_capture.nested(),
             metadata=metadata,
             metadata_ctrl=metadata_ctrl,
-            on_enter_callback=on_test_step_enter_callback,
-            on_exit_callback=on_test_step_exit_callback,
+            on_enter_callback=self._on_test_step_enter,
+            on_exit_callback=self._on_test_step_exit,
+            max_log_records=self._max_log_records,
         )
         self._supervision_registry[metadata] = test_step_supervision
         return test_step_supervision
 
+    def _on_test_step_enter(self, metadata: TestStepMetadata):
+        self._test_step_stack.append(metadata)
+        if self._on_test_step_enter_callback is not None:
+            self._on_test_step_enter_callback(metadata)
+
+    def _on_test_step_exit(self, metadata: TestStepMetadata):
+        assert self._test_step_stack[-1] is metadata
+        self._latest_test_step = self._test_step_stack.pop()
+        if len(self._test_step_stack) == 0:
+            self._latest_root_test_step = self._latest_test_step
+        if self._on_test_step_exit_callback is not None:
+            self._on_test_step_exit_callback(metadata)
+
+    def resupervise_test_step(
+            self, supervision: TestStepSupervision,
+    ) -> TestStepSupervision:
+        """prepares a TestStepSupervision for repeating its TestStep
+
+        Each attempt gets TestStepMetadata of its own, so the outcome of the
+        previous attempts (including their embedded TestSteps) is retained.
+
+        :param supervision: supervision of the TestStep to repeat
+        :returns: TestStepSupervision: the very same supervision, reset.
+        """
+        metadata, metadata_ctrl = TestStepMetadata.create_controlled_metadata(
+            parent=self.active_test_step,
+            function=supervision.metadata.test_step)
+        supervision._begin_new_attempt(
+            self._log_capture.nested(), metadata, metadata_ctrl)
+        self._supervision_registry[metadata] = supervision
+        return supervision
+
     @property
     def active_test_step(self) -> TestStepMetadata | None:
         """get the currently active TestStep's metadata"""
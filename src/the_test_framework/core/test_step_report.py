@@ -8,14 +8,14 @@ from typing import Any
 from .dtypes import TestResult, ExcInfo
 
 
-@dataclass
+@dataclass(slots=True)
 class TestStepReport:
     name: str
     test_result: TestResult
     start_time: datetime.datetime
     end_time: datetime.datetime
     log_messages: list[LogRecord]
-    children: list[TestStepReport]
+    children: tuple[TestStepReport, ...]
     parent: TestStepReport | None
     return_value: Any
     exc_info: ExcInfo | None
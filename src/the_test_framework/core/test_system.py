@@ -9,12 +9,11 @@ from .test_step.supervision import TestStepSupervisor
 if TYPE_CHECKING:
     from .test_step import DecoratedTestStep
 
-import sys
+import threading
+from contextvars import ContextVar
 from contextlib import contextmanager, ExitStack
 from dataclasses import dataclass
-import time
 from threading import Thread
-from multiprocessing import Value
 from multiprocessing.sharedctypes import Synchronized
 from typing import Callable, TypeVar, ParamSpec, Any
 from logging import getLogger
@@ -30,14 +29,29 @@ from the_test_framework.core.callback_registry import CallbackRegistry
 
 logger = getLogger(__name__)
 
+# per thread state, see TestSystem._active_instances()
+_thread_state = threading.local()
+
 
 P = ParamSpec("P")
 R = TypeVar("R")
 
 
+class InProcessValue:
+    """stand-in for multiprocessing.Value, when sharing among threads suffices
+
+    Reading and writing `value` is a plain attribute access, while a
+    multiprocessing.Value takes a (cross-process) lock on each access.
+    """
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+
 @dataclass
 class SharedMemory:
-    running: Synchronized
+    running: Synchronized | InProcessValue
 
 
 class ClusterFuckException(Exception):
@@ -53,20 +67,32 @@ class TestSystem:
 
     def __init__(
             self,
-            running: Synchronized | None = None,
+            running: Synchronized | InProcessValue | None = None,
             log_capture: LogCapture | None = None,
+            max_log_records: int | None = None,
     ):
-        running = running or Value("b", True)
+        """
+        :param max_log_records: retain only this many of the most recent log
+            records per TestStep (None retains all of them)
+        """
+        # pass a multiprocessing.Value to share the state with subprocesses
+        running = InProcessValue(True) if running is None else running
         self._shared_memory = SharedMemory(running=running)
         self._callback_registry = CallbackRegistry()
         self._error_handler = error_handler
         self._is_there_shit_on_the_fan = False
-        self._do_not_abort = False
+        # a context variable keeps concurrent never_abort() regions apart
+        self._do_not_abort: ContextVar[bool] = ContextVar(
+            f"do_not_abort_{id(self):x}", default=False)
         self.monitor = TestSystemMonitor()
         self._quit_requested = False
+        # set as soon as quitting is requested or the test system is wrecked
+        self._shutdown_event = threading.Event()
         self._log_capture = LogCapture() if log_capture is None else log_capture
+        self._max_log_records = max_log_records
 
-        self._test_step_supervisor = TestStepSupervisor()
+        self._test_step_supervisor = TestStepSupervisor(
+            max_log_records=max_log_records)
 
     def _raise_accumulated_errors(self):
         if not self.monitor.wrecked:
@@ -88,26 +114,25 @@ class TestSystem:
     # In order to allow to use a test_step with different test systems, it
     # can't be bound to a specific instance of TestSystem. To provide
     # instance-agnostic callbacks to the test_step decorator, those callbacks
-    # are specified as class-methods. At runtime, a little introspection helps
-    # to determine which instance of TestSystem was causing the call of the
-    # class-method.
+    # are specified as class-methods. At runtime, each thread keeps track of
+    # the instances whose execution loop it is running, which determines the
+    # instance of TestSystem that was causing the call of the class-method.
+
+    @classmethod
+    def _active_instances(cls) -> list[TestSystem]:
+        """TestSystem instances executed by the current thread, innermost last"""
+        try:
+            return _thread_state.active_instances
+        except AttributeError:
+            _thread_state.active_instances = []
+            return _thread_state.active_instances
 
     @classmethod
     def get_active_instance(cls):
         """returns the TestSystem instance under which the call to this method was issued"""
-        # Start from this frame and walk upward
-        f = sys._getframe()  # deeply_hidden_callback
-        while f:
-            code = f.f_code
-            # Look for a frame executing a __call__ method
-            if code.co_name == '_test_system_exec_loop':
-                # co_varnames[0] is the first positional parameter name
-                if code.co_argcount >= 1:
-                    first_arg = code.co_varnames[0]
-                    candidate = f.f_locals.get(first_arg)
-                    if isinstance(candidate, cls):
-                        return candidate
-            f = f.f_back
+        active_instances = cls._active_instances()
+        if active_instances and isinstance(active_instances[-1], cls):
+            return active_instances[-1]
         raise NoTestSystemInstanceFound(
             f"Couldn't identify {cls.__name__} instance, which"
             f"issued the call to _find_calling_instance_()!")
@@ -120,7 +145,7 @@ class TestSystem:
 
     def _quit_if_appropriate(self):
         if self._quit_requested:
-            if self._do_not_abort:
+            if self._do_not_abort.get():
                 logger.warning("test-system-exit requested while operating "
                                "under do-not-abort constraint!")
             else:
@@ -159,14 +184,20 @@ class TestSystem:
         ...     # do stuff which shall not be aborted
         ... # do stuff which can be aborted
         """
-        self._do_not_abort = True
-        yield
-        self._do_not_abort = False
+        token = self._do_not_abort.set(True)
+        try:
+            yield
+        finally:
+            self._do_not_abort.reset(token)
 
     @property
     def do_not_abort(self):
-        """whether the system shall momentarily prevent all abortion attempts"""
-        return self._do_not_abort
+        """whether the system shall momentarily prevent all abortion attempts
+
+        This reflects the never_abort() regions entered by the calling
+        thread (or asyncio task) only.
+        """
+        return self._do_not_abort.get()
 
     def restore_default_error_handler(self):
         self._error_handler = error_handler
@@ -180,6 +211,7 @@ class TestSystem:
         """quit the test system - bind this function to a GUI's exit button"""
         logger.info("abort test system")
         self._quit_requested = True
+        self._shutdown_event.set()
 
     # *************************************************************************
     # The Decorators
@@ -389,6 +421,8 @@ class TestSystem:
         return func
 
     def _test_system_exec_loop(self):
+        active_instances = self._active_instances()
+        active_instances.append(self)
         stack = ExitStack()
         try:
             system_setup_data = self._callback_registry.system_setup(exit_stack=stack)
@@ -406,11 +440,13 @@ class TestSystem:
                             exit_stack=uut_exit_stack)
                     except QuitTestSystem:  # handle error during uut setup
                         self._quit_requested = True
+                        self._shutdown_event.set()
                         break
                     except Exception as e:
                         logger.exception("caught exception during UUT setup!", exc_info=e)
                         self._error_handler(e)
                         self._is_there_shit_on_the_fan = True
+                        self._shutdown_event.set()
                         break
 
                     self._raise_accumulated_errors()
@@ -419,7 +455,8 @@ class TestSystem:
                         sequence_supervision,
                         self._test_step_supervisor
                     ) = TestSequenceSupervision.setup_supervision(
-                        log_capture=self._log_capture.nested())
+                        log_capture=self._log_capture.nested(),
+                        max_log_records=self._max_log_records)
 
                     try:
                         with sequence_supervision:
@@ -432,11 +469,13 @@ class TestSystem:
                         logger.info("terminated test sequence!")
                     except QuitTestSystem:  # handle error during system setup
                         self._quit_requested = True
+                        self._shutdown_event.set()
                         break
                     except Exception as e:
                         logger.exception("caught exception during main sequence!", exc_info=e)
                         self._error_handler(e)
                         self._is_there_shit_on_the_fan = True
+                        self._shutdown_event.set()
                         break
                     finally:
                         self._callback_registry.uut_recovery(
@@ -453,14 +492,17 @@ class TestSystem:
 
         except QuitTestSystem:   # handle error during system setup
             self._quit_requested = True
+            self._shutdown_event.set()
         except Exception as e:
             logger.exception("caught exception during !", exc_info=e)
             self._error_handler(e)
             self._is_there_shit_on_the_fan = True
+            self._shutdown_event.set()
         finally:
             stack.close()
             logger.info("torn down the test system")
             self.running = False
+            active_instances.pop()
 
     def __call__(self):
         self._callback_registry.check()
@@ -476,12 +518,15 @@ class TestSystem:
         self._test_system_exec_thread.start()
 
         try:
-            while not self._quit_requested and not self._is_there_shit_on_the_fan:
-                time.sleep(0.1)
+            # the timeout merely keeps the wait interruptible by a
+            # KeyboardInterrupt on platforms which won't interrupt lock waits
+            while not self._shutdown_event.wait(timeout=1.0):
+                pass
         except KeyboardInterrupt:
             logger.info("caught keyboard interrupt! "
                         "Terminating test system execution")
             self._quit_requested = True
+            self._shutdown_event.set()
             self.running = False
 
         logger.info("almost done!")
@@ -4,6 +4,7 @@ from .others import (
     preview,
     HasRepr,
     enforce_presence_of_class_attributes,
+    weakly_memoized,
 )
 from .tetchy_tftp import TetchyTFTPServer
 
@@ -14,5 +15,6 @@ __all__ = [
     "origin_of_func",
     "log_record_to_dict",
     "enforce_presence_of_class_attributes",
+    "weakly_memoized",
     "TetchyTFTPServer",
 ]
@@ -1,4 +1,6 @@
 from typing import Protocol, Mapping, Any, Callable
+from weakref import WeakKeyDictionary
+import functools
 import inspect
 
 
@@ -8,6 +10,10 @@ class HasRepr(Protocol):
 
 def preview(obj: HasRepr, max_len: int = 79) -> str:
     """shortens a text"""
+    if isinstance(obj, (str, bytes)) and len(obj) > max_len:
+        # the preview covers no more than max_len characters anyway, hence
+        # there's no point in rendering the representation of all of them
+        obj = obj[:max_len]
     text = repr(obj)
     if len(text) > max_len:
         text = text[:max_len - 4] + " ..."
@@ -42,8 +48,46 @@ def enforce_presence_of_class_attributes(cls,
                             f"(got: {type(cls.__dict__[attribute_name])})!")
 
 
+def weakly_memoized[R](
+        inspector: Callable[[Callable], R]
+) -> Callable[[Callable], R]:
+    """memoize the result of `inspector` per inspected function
+
+    The cache is weakly keyed, such that dynamically created callables
+    (e.g. functools.partial) aren't kept alive by it. Callables which aren't
+    weak referenceable are inspected on every call.
+    """
+    cache: WeakKeyDictionary[Callable, R] = WeakKeyDictionary()
+
+    @functools.wraps(inspector)
+    def _memoized_inspector(func: Callable) -> R:
+        try:
+            return cache[func]
+        except (KeyError, TypeError):
+            pass
+        result = inspector(func)
+        try:
+            cache[func] = result
+        except TypeError:
+            # func is not weak referenceable (or not hashable)
+            pass
+        return result
+    return _memoized_inspector
+
+
+@weakly_memoized
+def _origin_from_source(func: Callable) -> tuple[str | None, int]:
+    """locate `func` by inspecting its source (expensive)"""
+    return inspect.getsourcefile(func), inspect.getsourcelines(func)[1]
+
+
 def origin_of_func(func: Callable) -> str:
     func_name = func.__name__
-    file = inspect.getsourcefile(func)
-    line_no = inspect.getsourcelines(func)[1]
+    # functions (and methods) carry their origin on their code object, which
+    # spares reading and tokenizing the source file
+    code = getattr(inspect.unwrap(func), "__code__", None)
+    if code is not None:
+        file, line_no = code.co_filename, code.co_firstlineno
+    else:
+        file, line_no = _origin_from_source(func)
     return f'{file}:{line_no} {func_name}():'
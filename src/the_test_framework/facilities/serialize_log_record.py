@@ -1,19 +1,33 @@
-import datetime
 import json
+import time
 import traceback
 import logging
 
 
 # From logging docs + CPython source; used to detect "extras"
-_STANDARD_ATTRS = {
+_STANDARD_ATTRS = frozenset({
     'name','msg','args','levelname','levelno','pathname','filename','module',
     'exc_info','exc_text','stack_info','lineno','funcName','created','msecs',
     'relativeCreated','thread','threadName','process','processName',
-    'taskName'  # present when using asyncio
-}
+    'taskName',  # present when using asyncio
+    'message','asctime',  # injected once a logging.Formatter formatted it
+})
+
+# types which are JSON-serializable as is
+_PRIMITIVE = (str, int, float, bool, type(None))
 
 def _safe_jsonable(obj):
     """Return obj if JSON-serializable; else a repr() fallback."""
+    if isinstance(obj, _PRIMITIVE):
+        return obj
+    # flat containers of primitives (like most `args`) need no probing either
+    if isinstance(obj, (list, tuple)):
+        if all(isinstance(v, _PRIMITIVE) for v in obj):
+            return obj
+    elif isinstance(obj, dict):
+        if all(isinstance(k, str) and isinstance(v, _PRIMITIVE)
+               for k, v in obj.items()):
+            return obj
     try:
         json.dumps(obj)
         return obj
@@ -23,7 +37,33 @@ def _safe_jsonable(obj):
         except Exception:
             return f"<unreprable {type(obj).__name__}>"
 
-def log_record_to_dict(r: logging.LogRecord) -> dict:
+# (whole second, its local ISO representation) - records come in bursts
+# within the same second, so the expensive part of the formatting is shared;
+# replaced as a whole, hence consistent even when accessed concurrently
+_cached_second: tuple[int | None, str] = (None, "")
+
+def _iso_timestamp(r: logging.LogRecord) -> str:
+    """local ISO 8601 representation of `r.created`, with millisecond precision
+
+    Milliseconds are taken from `r.msecs`, which LogRecord computed already
+    (just like logging.Formatter does for `%(msecs)03d`).
+    """
+    global _cached_second
+    sec = int(r.created)
+    cached_sec, prefix = _cached_second
+    if cached_sec != sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(sec))
+        _cached_second = (sec, prefix)
+    return f"{prefix}.{int(r.msecs):03d}"
+
+def log_record_to_dict(r: logging.LogRecord,
+                       format_traceback: bool = True) -> dict:
+    """render a LogRecord as JSON-serializable dict
+
+    :param format_traceback: whether to render the traceback of an attached
+        exception, which is by far the most expensive part of serializing
+        such a record; skip it if the record's traceback is of no interest.
+    """
     # Render message with args
     try:
         rendered = r.getMessage()
@@ -37,19 +77,27 @@ def log_record_to_dict(r: logging.LogRecord) -> dict:
         exc = {
             "type": getattr(etype, "__name__", str(etype)),
             "message": str(evalue),
-            "traceback": "".join(traceback.format_exception(etype, evalue, etb)),
+            "traceback": ("".join(traceback.format_exception(etype, evalue, etb))
+                          if format_traceback else None),
         }
 
-    # Extras (anything user supplied via `extra=...`)
+    # Extras (anything user supplied via `extra=...`), in the order given
+    record_attrs = r.__dict__
     extras = {
         k: _safe_jsonable(v)
-        for k, v in r.__dict__.items()
+        for k, v in record_attrs.items()
         if k not in _STANDARD_ATTRS
     }
 
     # Epoch and ISO timestamps
     ts = r.created
-    ts_iso = datetime.datetime.fromtimestamp(ts).isoformat(timespec="milliseconds")
+    ts_iso = _iso_timestamp(r)
+
+    msg = r.msg
+    # most log calls pass no args at all - those need no inspection
+    args = r.args
+    if args:
+        args = _safe_jsonable(args)
 
     return {
         "timestamp": ts,
@@ -66,10 +114,10 @@ def log_record_to_dict(r: logging.LogRecord) -> dict:
         "process_name": r.processName,
         "thread_id": r.thread,
         "thread_name": r.threadName,
-        "task_name": getattr(r, "taskName", None),   # asyncio, if available
+        "task_name": r.taskName,                     # asyncio task, if any
         "message": rendered,                         # msg with args applied
-        "msg_template": r.msg if isinstance(r.msg, str) else repr(r.msg),
-        "msg_args": _safe_jsonable(r.args),   # keep machine-readable form too
+        "msg_template": msg if isinstance(msg, str) else repr(msg),
+        "msg_args": args,                     # keep machine-readable form too
         "stack_info": r.stack_info,
         "exception": exc,
         "extras": extras,
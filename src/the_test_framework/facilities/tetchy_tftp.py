@@ -1,10 +1,15 @@
+from contextlib import contextmanager
 from logging import getLogger
+import io
 import os
 import socket
+import struct
 import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from multiprocessing.sharedctypes import Synchronized, Value
-from typing import Dict, Tuple, Protocol
-from threading import Thread
+from typing import Callable, Dict, Iterator, Tuple, Protocol
 import uuid
 
 
@@ -28,11 +33,54 @@ ERR_NO_USER = 7
 DEFAULT_BLKSIZE = 512
 MIN_BLKSIZE = 8
 MAX_BLKSIZE = 1468  # fits in Ethernet MTU 1500 (20 IP + 8 UDP + 4 TFTP)
+# RFC 7440 windows; must stay well below half of the 16 bit block number
+# space, otherwise a stale ACK can't be told from one within the window
+MAX_WINDOWSIZE = 512
+
+# <2B opcode> <2B block number or error code> - leads DATA, ACK and ERROR
+_HEADER = struct.Struct(">HH")
+
+# names of the options _negotiate() may acknowledge, as sent in an OACK
+_OPTION_NAMES = {name: name.encode("ascii")
+                 for name in ("blksize", "timeout", "tsize", "windowsize")}
+
+# progress is reported every N blocks or after this many seconds, whichever
+# comes first - and always for the last block
+PROGRESS_REPORT_BLOCKS = 64
+PROGRESS_REPORT_INTERVAL = 0.05
 
 
 logger = getLogger(__name__)
 
 
+# reads the block at an offset of a file into a buffer, returns its length
+BlockReader = Callable[[int, memoryview], int]
+
+
+def _readinto_fully(f: io.RawIOBase, buf: memoryview) -> int:
+    """fill `buf` from `f` - the result is short only at the end of the file"""
+    n = f.readinto(buf) or 0
+    while 0 < n < len(buf):
+        more = f.readinto(buf[n:])
+        if not more:
+            break
+        n += more
+    return n
+
+
+def _copy_reader(content: bytes) -> BlockReader:
+    """BlockReader serving blocks from a copy of a file"""
+    view = memoryview(content)
+
+    def read_block(offset: int, buf: memoryview) -> int:
+        chunk = view[offset:offset + len(buf)]
+        n = len(chunk)
+        buf[:n] = chunk
+        return n
+
+    return read_block
+
+
 class NewTransferCallback(Protocol):
     def __call__(self, client_addr: str, filename: str, transfer_id: str):
         """called when a new read request for a file is received
@@ -64,10 +112,14 @@ class UpdateSentBytesCallback(Protocol):
 
 class GossipGirlie:
     """manages communication with non-TFTP entities for TetchyTFTPServer"""
-    def __init__(self):
+    def __init__(self, max_workers: int = 4):
         self._new_transfer_callbacks: dict[str, NewTransferCallback] = {}
         self._transfer_ended_callbacks: dict[str, TransferEndedCallback] = {}
         self._update_sent_bytes_callbacks: dict[str, UpdateSentBytesCallback] = {}
+        # callbacks are issued once per ACKed block - reuse worker threads
+        # rather than spawning a thread per callback
+        self._pool = ThreadPoolExecutor(max_workers=max_workers,
+                                        thread_name_prefix="GossipGirlie")
 
     def _issue_new_transfer_callback(
             self,
@@ -84,8 +136,9 @@ class GossipGirlie:
         kwargs = {"client_addr": client_addr,
                   "filename": filename,
                   "transfer_id": transfer_id}
-        for callback in self._new_transfer_callbacks.values():
-            Thread(target=callback, kwargs=kwargs, daemon=True).start()
+        # snapshot, as (un)subscribing may happen concurrently
+        for callback in list(self._new_transfer_callbacks.values()):
+            self._pool.submit(callback, **kwargs)
 
     def _issue_transfer_ended_callback(
             self,
@@ -98,8 +151,9 @@ class GossipGirlie:
         :param error: optional error message
         """
         kwargs = {"transfer_id": transfer_id, "error": error}
-        for callback in self._transfer_ended_callbacks.values():
-            Thread(target=callback, kwargs=kwargs, daemon=True).start()
+        # snapshot, as (un)subscribing may happen concurrently
+        for callback in list(self._transfer_ended_callbacks.values()):
+            self._pool.submit(callback, **kwargs)
 
     def _issue_update_sent_bytes_callback(
             self,
@@ -117,8 +171,9 @@ class GossipGirlie:
         kwargs = {"transfer_id": transfer_id,
                   "sent_bytes": sent_bytes,
                   "total_size": total_size}
-        for callback in self._update_sent_bytes_callbacks.values():
-            Thread(target=callback, kwargs=kwargs, daemon=True).start()
+        # snapshot, as (un)subscribing may happen concurrently
+        for callback in list(self._update_sent_bytes_callbacks.values()):
+            self._pool.submit(callback, **kwargs)
 
     def subscribe(
             self,
@@ -141,6 +196,10 @@ class GossipGirlie:
         self._update_sent_bytes_callbacks.pop(subscription_id, None)
         self._transfer_ended_callbacks.pop(subscription_id, None)
 
+    def close(self):
+        """stop issuing callbacks - pending ones are still carried out"""
+        self._pool.shutdown(wait=False)
+
 
 class TetchyTFTPServer:
     """TFTP Server, which reports"""
@@ -154,16 +213,45 @@ class TetchyTFTPServer:
             default_blksize: int = DEFAULT_BLKSIZE,
             running: Synchronized | None = None,
             sent_bytes: Synchronized | None = None,
+            sock_rcvbuf: int | None = 4 * 1024 * 1024,
+            sock_sndbuf: int | None = 4 * 1024 * 1024,
+            max_concurrent_transfers: int = 32,
+            file_cache_bytes: int = 64 * 1024 * 1024,
+            max_queued_requests: int = 64,
     ):
         self.root = os.path.abspath(root)
+        # paths within root start with this (root itself ending in a separator)
+        self._root_prefix = os.path.join(self.root, "")
         self.host = host
         self.port = port
         self.timeout = timeout
         self.retries = retries
         self.default_blksize = max(MIN_BLKSIZE, min(default_blksize, MAX_BLKSIZE))
         self._running: Synchronized = running or Value("b", True)       # pyright: ignore reportAttributeAccessIssue
-        self._sent_bytes: Synchronized = sent_bytes or Value("i", True) # pyright: ignore reportAttributeAccessIssue
+        # 64 bit, as a 32 bit counter would overflow after 2 GiB
+        self._sent_bytes: Synchronized = sent_bytes or Value("q", 0)    # pyright: ignore reportAttributeAccessIssue
+        # enlarged socket buffers prevent packet drops (and thereby retries)
+        # under load; None keeps the system's default
+        self.sock_rcvbuf = sock_rcvbuf
+        self.sock_sndbuf = sock_sndbuf
         self._sock = None
+        self._err_sock: socket.socket | None = None
+        # requests beyond this many wait for a running transfer to end
+        self.max_concurrent_transfers = max_concurrent_transfers
+        self._handlers: ThreadPoolExecutor | None = None
+        # requests beyond this many waiting for a transfer to end are
+        # turned down
+        self.max_queued_requests = max_queued_requests
+        # (client address, filename) of the requests queued or being served
+        self._requests: set[Tuple[Tuple[str, int], str]] = set()
+        self._requests_lock = threading.Lock()
+        # copies of recently requested files, up to this many bytes in
+        # total - netboot clients tend to request the same few files over
+        # and over; 0 disables caching
+        self.file_cache_bytes = file_cache_bytes
+        self._file_cache: OrderedDict[str, Tuple[Tuple[int, int], bytes]] = OrderedDict()
+        self._file_cache_size = 0
+        self._file_cache_lock = threading.Lock()
         os.makedirs(self.root, exist_ok=True)
 
         self.ipc = GossipGirlie()
@@ -173,39 +261,124 @@ class TetchyTFTPServer:
         with self._sent_bytes.get_lock():
             return self._sent_bytes.value
 
+    def _mkudp(self) -> socket.socket:
+        """create a UDP socket with the configured buffer sizes"""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        for option, size in ((socket.SO_RCVBUF, self.sock_rcvbuf),
+                             (socket.SO_SNDBUF, self.sock_sndbuf)):
+            if size is None:
+                continue
+            try:
+                sock.setsockopt(socket.SOL_SOCKET, option, size)
+            except OSError as e:
+                # some systems refuse sizes beyond their limit
+                logger.debug("can't set socket buffer size to %d: %s", size, e)
+        return sock
+
+    @contextmanager
+    def _block_reader(self, path: str) -> Iterator[BlockReader]:
+        """provide a BlockReader for the file at `path`
+
+        Blocks are read into the caller's buffer rather than served from a
+        memory mapping: a file truncated while being served merely comes
+        out short, whereas touching a truncated mapping raises SIGBUS.
+        Files fitting the file cache are served from a copy instead.
+        """
+        with open(path, 'rb', buffering=0) as f:
+            content = self._cached_copy(path, f)
+            if content is not None:
+                yield _copy_reader(content)
+                return
+            if hasattr(os, "posix_fadvise"):
+                # files are sent front to back - let the kernel read ahead
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            position = f.tell()
+
+            def read_block(offset: int, buf: memoryview) -> int:
+                nonlocal position
+                # blocks are read in sequence, except for retransmissions
+                if offset != position:
+                    f.seek(offset)
+                n = _readinto_fully(f, buf)
+                position = offset + n
+                return n
+
+            yield read_block
+
+    def _cached_copy(self, path: str, f: io.RawIOBase) -> bytes | None:
+        """get the cached copy of the file `f`, opened from `path`
+
+        Unlike a mapping, a copy is unaffected by whatever happens to the
+        file while it is served. A copy is reused as long as size and
+        modification time of the file remain; it's freed once it was
+        evicted (or the server stopped) and no transfer still sends it.
+
+        :return: the file's content or None, if it isn't to be cached
+        """
+        if self.file_cache_bytes <= 0:
+            return None
+        st = os.fstat(f.fileno())
+        key = (st.st_mtime_ns, st.st_size)
+        with self._file_cache_lock:
+            cached = self._file_cache.get(path)
+            if cached is not None and cached[0] == key:
+                self._file_cache.move_to_end(path)
+                return cached[1]
+        if st.st_size > self.file_cache_bytes:
+            return None
+        content = f.read()
+        if len(content) != st.st_size:
+            # the file is just being rewritten - don't keep this copy
+            f.seek(0)
+            return None
+        with self._file_cache_lock:
+            replaced = self._file_cache.pop(path, None)
+            if replaced is not None:
+                self._file_cache_size -= len(replaced[1])
+            self._file_cache[path] = (key, content)
+            self._file_cache_size += len(content)
+            while self._file_cache_size > self.file_cache_bytes:
+                _, (_, evicted) = self._file_cache.popitem(last=False)
+                self._file_cache_size -= len(evicted)
+        return content
+
     def _safe_path(self, name: str) -> str | None:
         # Disallow directory traversal and absolute paths
         name = name.replace("\\", "/")
-        p = os.path.abspath(os.path.normpath(os.path.join(self.root, name)))
-        if not p.startswith(self.root + os.sep) and p != self.root:
+        # root is absolute, hence so is the joined path - normalizing it is
+        # all that abspath() would do, without its getcwd() call
+        p = os.path.normpath(os.path.join(self.root, name))
+        if not p.startswith(self._root_prefix) and p != self.root:
             return None
         return p
 
     def _recv_req(self, data: bytes) -> Tuple[int, str, str, Dict[str,str]]:
         # Parse RRQ/WRQ: <2B opcode> <filename> 0 <mode> 0 [opt\0val\0]...
         op = int.from_bytes(data[:2], 'big')
-        parts = data[2:].split(b"\x00")
+        # decoding the request as a whole spares decoding each field on its
+        # own - a NUL byte never is part of a multibyte sequence
+        parts = data[2:].decode(errors='ignore').split("\x00")
         if len(parts) < 2:
             raise ValueError("malformed request")
-        filename = parts[0].decode(errors='ignore')
-        mode = parts[1].decode(errors='ignore').lower()
+        filename = parts[0]
+        mode = parts[1].lower()
         opts: Dict[str, str] = {}
         for i in range(2, len(parts) - 1, 2):
-            k = parts[i].decode(errors='ignore').lower()
-            v = parts[i+1].decode(errors='ignore')
+            k = parts[i].lower()
             if k:
-                opts[k] = v
+                opts[k] = parts[i+1]
         return op, filename, mode, opts
 
-    def _oack(self, sock, addr, opts) -> bool:
+    def _oack(self, sock, addr, opts: Dict[str, int]) -> bool:
         # Build OACK
-        payload = b"\x00" + bytes([OP_OACK])
+        parts = [OP_OACK.to_bytes(2, 'big')]
         for k, v in opts.items():
-            payload += k.encode() + b"\x00" + str(v).encode() + b"\x00"
+            parts += (_OPTION_NAMES[k], b"\x00", b"%d" % v, b"\x00")
+        payload = b"".join(parts)
 
+        sock.settimeout(self.timeout)
         for attempt in range(self.retries):
             sock.sendto(payload, addr)
-            sock.settimeout(self.timeout)
             try:
                 pkt, src = sock.recvfrom(2048)
             except socket.timeout:
@@ -217,29 +390,28 @@ class TetchyTFTPServer:
                 continue
 
             # ACK(0) = 0x00 0x04 0x00 0x00
-            if len(pkt) >= 4 and pkt[1] == OP_ACK and pkt[2:4] == b"\x00\x00":
+            if len(pkt) >= 4 and _HEADER.unpack_from(pkt) == (OP_ACK, 0):
                 return True
         return False
 
     def _send_error(self, sock: socket.socket, addr: Tuple[str,int], code: int, msg: str):
-        pkt = b"\x00" + bytes([OP_ERROR]) + code.to_bytes(2,'big') + msg.encode() + b"\x00"
+        pkt = _HEADER.pack(OP_ERROR, code) + msg.encode() + b"\x00"
         try:
             sock.sendto(pkt, addr)
         except Exception:
             pass
 
     def _send_ack(self, sock: socket.socket, addr: Tuple[str,int], block: int):
-        pkt = b"\x00" + bytes([OP_ACK]) + block.to_bytes(2,'big')
-        sock.sendto(pkt, addr)
+        sock.sendto(_HEADER.pack(OP_ACK, block), addr)
 
-    def _send_data(self, sock: socket.socket, addr: Tuple[str,int], block: int, chunk: bytes):
-        pkt = b"\x00" + bytes([OP_DATA]) + block.to_bytes(2,'big') + chunk
-        sock.sendto(pkt, addr)
-        with self._sent_bytes.get_lock():
-            self._sent_bytes.value += len(chunk)
+    def _negotiate(self, opts: Dict[str, str], filesize: int | None = None,
+                   windowed: bool = False) -> Dict[str, int]:
+        """pick the options to acknowledge
 
-    def _negotiate(self, opts: Dict[str, str], filesize: int | None = None) -> \
-    Dict[str, int]:
+        :param filesize: size of the requested file for a RRQ
+        :param windowed: whether the transfer supports RFC 7440 windows;
+            the windowsize is capped at MAX_WINDOWSIZE
+        """
         accepted: Dict[str, int] = {}
         if 'blksize' in opts:
             try:
@@ -257,11 +429,70 @@ class TetchyTFTPServer:
             # If client asked tsize=0 on RRQ, reply with the real size
             if filesize is not None:
                 accepted['tsize'] = max(0, int(filesize))
+        if 'windowsize' in opts and windowed:
+            try:
+                w = int(opts['windowsize'])
+                accepted['windowsize'] = max(1, min(w, MAX_WINDOWSIZE))
+            except Exception:
+                pass
         return accepted
 
-    def _handle_rrq(self, client_addr: Tuple[str, int], filename: str, mode: str, opts: Dict[str, str]):
+    def _await_ack(self, sock: socket.socket, addr: Tuple[str, int],
+                   index: int, window: int, rxbuf: bytearray) -> int:
+        """wait for the ACK of a window of DATA blocks
+
+        Stale ACKs (of blocks prior to the window) are ignored rather than
+        answered with a retransmission, which would duplicate all traffic
+        from there on (Sorcerer's Apprentice Syndrome).
+
+        :param index: index of the window's first block (counting from 0)
+        :param window: number of blocks sent in the window
+        :param rxbuf: buffer to receive into, reused for every packet
+        :return: number of blocks ACKed, 0 on timeout
+        """
+        while True:
+            try:
+                nbytes, src = sock.recvfrom_into(rxbuf)
+            except socket.timeout:
+                return 0
+
+            if src != addr:
+                self._send_error(sock, src, ERR_UNKNOWN_TID,
+                                 "Unknown transfer ID")
+                continue
+            if nbytes < 4:
+                continue
+            opcode, ack_block = _HEADER.unpack_from(rxbuf)
+            if opcode == OP_ACK:
+                # block numbers roll over from 65535 to 1, never 0
+                acked = (ack_block - 1 - index) % 0xFFFF + 1
+                if ack_block and acked <= window:
+                    return acked
+
+    def _transfer(self, op_req: int, client_addr: Tuple[str, int], filename: str,
+                  mode: str, opts: Dict[str, str]):
+        """carry out a request, so that its failure doesn't pass unnoticed"""
         transfer_id = uuid.uuid4().hex
-        self.ipc._issue_new_transfer_callback(transfer_id, client_addr[0], filename)
+        try:
+            if op_req == OP_RRQ:
+                self._handle_rrq(client_addr, filename, mode, opts, transfer_id)
+            else:
+                self._handle_wrq(client_addr, filename, mode, opts)
+        except Exception:
+            logger.exception("%s %s from %s failed",
+                             "RRQ" if op_req == OP_RRQ else "WRQ",
+                             filename, client_addr)
+            if op_req == OP_RRQ:
+                self.ipc._issue_transfer_ended_callback(transfer_id, "internal error")
+            self._send_error(self._err_sock, client_addr, ERR_UNDEF, "Internal error")
+        finally:
+            with self._requests_lock:
+                self._requests.discard((client_addr, filename))
+
+    def _handle_rrq(self, client_addr: Tuple[str, int], filename: str, mode: str,
+                    opts: Dict[str, str], transfer_id: str):
+        self.ipc._issue_new_transfer_callback(
+            client_addr=client_addr[0], filename=filename, transfer_id=transfer_id)
 
         if mode != 'octet':
             logger.info("RRQ rejected: mode %s not supported", mode)
@@ -270,18 +501,19 @@ class TetchyTFTPServer:
         if not path or not os.path.isfile(path):
             self.ipc._issue_transfer_ended_callback(transfer_id, "file not found!")
             logger.info("RRQ file not found: %s", filename)
-            # Respond from a new TID per RFC
-            tsock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            tsock.bind((self.host, 0))
-            self._send_error(tsock, client_addr, ERR_NOT_FOUND, "File not found")
-            tsock.close()
+            # Respond from a TID other than the server port per RFC
+            self._send_error(self._err_sock, client_addr, ERR_NOT_FOUND, "File not found")
             return
 
         filesize = os.path.getsize(path)
         blksize = self.default_blksize
-        accepted = self._negotiate(opts, filesize=filesize)
+        accepted = self._negotiate(opts, filesize=filesize, windowed=True)
+
+        # ACKed bytes are added to the shared counter along with each
+        # progress report, sparing its lock on every block
+        acked_bytes = counted_bytes = 0
 
-        tsock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        tsock = self._mkudp()
         tsock.bind((self.host, 0))
         tsock.settimeout(self.timeout)
         try:
@@ -290,49 +522,81 @@ class TetchyTFTPServer:
                     blksize = accepted['blksize']
 
                 # Wait for ACK(0). If the client doesn’t send it, fall back to DATA(1).
-                if not self._oack(tsock, client_addr,
-                                  {k: str(v) for k, v in accepted.items()}):
+                if not self._oack(tsock, client_addr, accepted):
                     logger.info(
                         "RRQ: no ACK to OACK from %s; falling back to sending DATA(1)",
                         client_addr)
 
-            block = 1
-
-            with open(path, 'rb') as f:
-                while True:
-                    chunk = f.read(blksize)
+            windowsize = accepted.get('windowsize', 1)
+            unreported_blocks = 0
+            last_report = time.monotonic()
+
+            # DATA packets are assembled in place, the file is read into
+            # them rather than by a fresh read() per block
+            packet = bytearray(4 + blksize)
+            packet_view = memoryview(packet)
+            payload = packet_view[4:]
+            rxbuf = bytearray(4 + 64)
+
+            with self._block_reader(path) as read_block:
+                # the first block shorter than blksize (if need be empty) is
+                # the last one - the file might change while it's served
+                last_index: int | None = None
+                last_len = 0
+                index = 0  # the first block not ACKed yet
+                # the per-packet callables, bound once for the whole transfer
+                pack_header = _HEADER.pack_into
+                sendto = tsock.sendto
+                while last_index is None or index <= last_index:
+                    # RFC 7440: send a window of blocks, then await their ACK
+                    window = (windowsize if last_index is None
+                              else min(windowsize, last_index + 1 - index))
                     for attempt in range(self.retries):
-                        self._send_data(tsock, client_addr, block, chunk)
-                        try:
-                            pkt, src = tsock.recvfrom(4 + 64)
-                        except socket.timeout:
-                            continue
-
-                        if src != client_addr:
-                            self._send_error(tsock, src, ERR_UNKNOWN_TID,
-                                             "Unknown transfer ID")
-                            continue
-                        if (len(pkt) >= 4 and pkt[1] == OP_ACK and
-                                int.from_bytes(pkt[2:4], 'big') == block):
-                            self.ipc._issue_update_sent_bytes_callback(
-                                transfer_id=transfer_id,
-                                sent_bytes=block * blksize,
-                                total_size=filesize)
+                        sent = 0
+                        for i in range(index, index + window):
+                            chunk_len = read_block(i * blksize, payload)
+                            # block numbers roll over from 65535 to 1
+                            pack_header(packet, 0, OP_DATA, i % 0xFFFF + 1)
+                            sendto(packet_view[:4 + chunk_len], client_addr)
+                            sent += 1
+                            if chunk_len < blksize:
+                                last_index, last_len = i, chunk_len
+                                break
+                        acked = self._await_ack(tsock, client_addr, index,
+                                                sent, rxbuf)
+                        if acked:
                             break
                     else:
                         logger.info("RRQ: retries exhausted to %s (block %d)",
-                                     client_addr, block)
+                                     client_addr, index % 0xFFFF + 1)
                         self.ipc._issue_transfer_ended_callback(
                             transfer_id, "retries exhausted")
                         return
 
-                    if len(chunk) < blksize:  # last block
-                        return
-                    block = (block + 1) & 0xFFFF
-                    if block == 0:
-                        block = 1
+                    index += acked
+                    last_block = last_index is not None and index > last_index
+                    # retransmissions aren't progress - count what got ACKed
+                    acked_bytes = (last_index * blksize + last_len if last_block
+                                   else index * blksize)
+                    unreported_blocks += acked
+                    now = time.monotonic()
+                    if (last_block
+                            or unreported_blocks >= PROGRESS_REPORT_BLOCKS
+                            or now - last_report >= PROGRESS_REPORT_INTERVAL):
+                        with self._sent_bytes.get_lock():
+                            self._sent_bytes.value += acked_bytes - counted_bytes
+                        counted_bytes = acked_bytes
+                        self.ipc._issue_update_sent_bytes_callback(
+                            transfer_id=transfer_id,
+                            sent_bytes=acked_bytes,
+                            total_size=filesize)
+                        unreported_blocks = 0
+                        last_report = now
         finally:
             tsock.close()
+            if acked_bytes > counted_bytes:
+                with self._sent_bytes.get_lock():
+                    self._sent_bytes.value += acked_bytes - counted_bytes
 
     def _handle_wrq(self, client_addr: Tuple[str,int], filename: str, mode: str, opts: Dict[str,str]):
         if mode != 'octet':
@@ -340,10 +604,7 @@ class TetchyTFTPServer:
             return
         path = self._safe_path(filename)
         if not path:
-            tsock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            tsock.bind((self.host, 0))
-            self._send_error(tsock, client_addr, ERR_ACCESS, "Access violation")
-            tsock.close()
+            self._send_error(self._err_sock, client_addr, ERR_ACCESS, "Access violation")
             return
 
         os.makedirs(os.path.dirname(path), exist_ok=True)
@@ -353,7 +614,7 @@ class TetchyTFTPServer:
 
         blksize = self.default_blksize
         accepted = self._negotiate(opts)
-        tsock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        tsock = self._mkudp()
         tsock.bind((self.host, 0))
         tsock.settimeout(self.timeout)
 
@@ -361,7 +622,7 @@ class TetchyTFTPServer:
             if accepted:
                 if 'blksize' in accepted:
                     blksize = accepted['blksize']
-                if not self._oack(tsock, client_addr, {k:str(v) for k,v in accepted.items()}):
+                if not self._oack(tsock, client_addr, accepted):
                     logger.info("WRQ: no DATA after OACK from %s", client_addr)
                     return
             else:
@@ -369,34 +630,36 @@ class TetchyTFTPServer:
                 self._send_ack(tsock, client_addr, 0)
 
             expected = 1
+            # every DATA packet is received into the same buffer and written
+            # from a view of it
+            rxbuf = bytearray(blksize + 4 + 64)
+            rxview = memoryview(rxbuf)
             with open(path, 'wb') as f:
                 while True:
                     for attempt in range(self.retries):
                         try:
-                            pkt, src = tsock.recvfrom(blksize + 4 + 64)
+                            nbytes, src = tsock.recvfrom_into(rxbuf)
                         except socket.timeout:
                             continue
                         if src != client_addr:
                             self._send_error(tsock, src, ERR_UNKNOWN_TID, "Unknown transfer ID")
                             continue
-                        if len(pkt) >= 4 and pkt[1] == OP_DATA:
-                            block = int.from_bytes(pkt[2:4], 'big')
-                            data = pkt[4:]
-                            if block == expected:
-                                f.write(data)
-                                self._send_ack(tsock, client_addr, block)
-                                if len(data) < blksize:
-                                    return  # last block
-                                expected = (expected + 1) & 0xFFFF
-                                if expected == 0:
-                                    expected = 1
-                                break
-                            else:
-                                # duplicate or out-of-order; re-ACK last received
-                                self._send_ack(tsock, client_addr, (expected - 1) & 0xFFFF)
-                        else:
-                            # ignore other packets
-                            pass
+                        if nbytes < 4:
+                            continue
+                        opcode, block = _HEADER.unpack_from(rxbuf)
+                        if opcode != OP_DATA:
+                            continue  # ignore other packets
+                        if block != expected:
+                            # duplicate or out-of-order; re-ACK last received
+                            self._send_ack(tsock, client_addr, (expected - 1) & 0xFFFF)
+                            continue
+                        f.write(rxview[4:nbytes])
+                        self._send_ack(tsock, client_addr, block)
+                        if nbytes - 4 < blksize:
+                            return  # last block
+                        # block numbers roll over from 65535 to 1
+                        expected = expected % 0xFFFF + 1
+                        break
                     else:
                         logger.info("WRQ: retries exhausted from %s (expect block %d)", client_addr, expected)
                         return
@@ -404,9 +667,6 @@ class TetchyTFTPServer:
             tsock.close()
 
     def _serve_once(self):
-        self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        self._sock.bind((self.host, self.port))
-        self._sock.settimeout(1.0)
         # Receive a single RRQ/WRQ on the control socket
         try:
             pkt, addr = self._sock.recvfrom(2048)
@@ -419,31 +679,59 @@ class TetchyTFTPServer:
         except ValueError as e:
             # illegal TFTP operation
             logger.exception("Illegal TFTP operation", exc_info=e)
-            es = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            es.bind((self.host, 0))
-            self._send_error(es, addr, ERR_ILLEGAL, "Illegal TFTP operation")
-            es.close()
+            self._send_error(self._err_sock, addr, ERR_ILLEGAL, "Illegal TFTP operation")
             return
 
         logger.info("%s %s from %s opts=%s",
                      "RRQ" if op_req==OP_RRQ else "WRQ" if op_req==OP_WRQ else str(op_req),
                      filename, addr, opts)
 
-        if op_req == OP_RRQ:
-            threading.Thread(target=self._handle_rrq, args=(addr, filename, mode, opts), daemon=True).start()
-        elif op_req == OP_WRQ:
-            threading.Thread(target=self._handle_wrq, args=(addr, filename, mode, opts), daemon=True).start()
-        else:
-            es = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            es.bind((self.host, 0))
-            self._send_error(es, addr, ERR_ILLEGAL, "Illegal TFTP operation")
-            es.close()
+        if op_req not in (OP_RRQ, OP_WRQ):
+            self._send_error(self._err_sock, addr, ERR_ILLEGAL, "Illegal TFTP operation")
+            return
+
+        request = (addr, filename)
+        with self._requests_lock:
+            # a client retransmits its request until the transfer begins -
+            # these must not start further transfers
+            if request in self._requests:
+                logger.debug("ignoring repeated request for %s from %s",
+                             filename, addr)
+                return
+            busy = len(self._requests) >= (self.max_concurrent_transfers
+                                           + self.max_queued_requests)
+            if not busy:
+                self._requests.add(request)
+        if busy:
+            logger.warning("turning down request for %s from %s: server busy",
+                           filename, addr)
+            self._send_error(self._err_sock, addr, ERR_UNDEF, "Server busy")
+            return
+        self._handlers.submit(self._transfer, op_req, addr, filename, mode, opts)
 
     def serve(self):
         logger.info("TFTP listening on %s:%d (root=%s)", self.host, self.port, self.root)
+        # errors which end a transfer before it began are all sent from this
+        # one socket (sendto() on a UDP socket is thread-safe)
+        self._err_sock = self._mkudp()
+        self._err_sock.bind((self.host, 0))
+        self._handlers = ThreadPoolExecutor(
+            max_workers=self.max_concurrent_transfers,
+            thread_name_prefix="tftp-xfer")
+        # the control socket is bound once - rebinding it for each request
+        # would drop any request arriving in between; the timeout merely
+        # lets the loop check whether it should still be running
+        self._sock = self._mkudp()
+        self._sock.bind((self.host, self.port))
+        self._sock.settimeout(1.0)
         try:
             while self._running.value:
                 self._serve_once()
         finally:
-            if self._sock is not None:
-                self._sock.close()
+            self._sock.close()
+            self._handlers.shutdown(wait=True)
+            self._err_sock.close()
+            with self._file_cache_lock:
+                self._file_cache.clear()
+                self._file_cache_size = 0
+
@@ -0,0 +1,57 @@
+import logging
+from typing import Annotated
+
+import pytest
+
+from the_test_framework.core.arg_flags import (
+    IsSystemSetupData,
+    IsUUTSetupData,
+    get_argument_by_type,
+    get_flagged_argument,
+)
+
+
+def pytest_flagged_argument():
+    def func(serial_no: Annotated[int, IsUUTSetupData, IsUUTSetupData],
+             station: Annotated[str, IsSystemSetupData]): ...
+
+    assert get_flagged_argument(func, IsUUTSetupData) == "serial_no"
+    assert get_flagged_argument(func, IsSystemSetupData) == "station"
+
+
+def pytest_ambiguous_flag():
+    def func(a: Annotated[int, IsUUTSetupData],
+             b: Annotated[int, IsUUTSetupData]): ...
+
+    with pytest.raises(RuntimeError, match="more than one"):
+        get_flagged_argument(func, IsUUTSetupData)
+
+
+def pytest_unflagged_argument(caplog):
+    def func(a: int, b: Annotated[int, IsSystemSetupData]): ...
+
+    with caplog.at_level(logging.WARNING):
+        assert get_flagged_argument(func, IsUUTSetupData) is None
+    assert "flagged as" in caplog.text
+
+
+def pytest_argument_by_type():
+    def func(a: float, b: Annotated[str, IsUUTSetupData], c): ...
+
+    assert get_argument_by_type(func, float) == "a"
+    assert get_argument_by_type(func, str) == "b"
+
+
+def pytest_ambiguous_type():
+    def func(a: float, b: Annotated[float, IsUUTSetupData]): ...
+
+    with pytest.raises(RuntimeError, match="more than one"):
+        get_argument_by_type(func, float)
+
+
+def pytest_untyped_argument(caplog):
+    def func(a, b: float): ...
+
+    with caplog.at_level(logging.WARNING):
+        assert get_argument_by_type(func, int) is None
+    assert "int" in caplog.text
@@ -0,0 +1,85 @@
+import logging
+from contextlib import ExitStack
+
+import pytest
+
+from the_test_framework.core.callback_registry.callbacks.actual_callbacks import (
+    SystemSetupCallback,
+)
+from the_test_framework.core.callback_registry.callbacks.assimilation import (
+    assimilate_function,
+)
+
+
+def _foreign(k1, k2, k3):
+    return {"k1": k1, "k2": k2, "k3": k3}
+
+
+def pytest_keyword_dispatch():
+    assimilated = assimilate_function(_foreign, {"a": "k2", "b": "k3", "c": "k1"})
+    assert assimilated(a=1, b=2, c=3) == {"k1": 3, "k2": 1, "k3": 2}
+
+
+def pytest_positional_dispatch():
+    assimilated = assimilate_function(
+        _foreign, {"a": "k2", "b": "k3", "c": "k1"}, ("a", "b", "c"))
+    assert assimilated(1, 2, 3) == {"k1": 3, "k2": 1, "k3": 2}
+    assert assimilated(1, c=3, b=2) == {"k1": 3, "k2": 1, "k3": 2}
+
+
+def pytest_foreign_default_switches_to_keywords():
+    """arguments following a defaulted foreign parameter go by keyword"""
+    def foreign(k1, k2="default", k3=None):
+        return k1, k2, k3
+
+    assimilated = assimilate_function(foreign, {"a": "k1", "b": "k3"}, ("a", "b"))
+    assert assimilated(1, 2) == (1, "default", 2)
+
+
+def pytest_keyword_only_native_arguments():
+    """translated arguments beyond `native_arg_names` are keyword only"""
+    assimilated = assimilate_function(
+        _foreign, {"a": "k1", "b": "k2", "c": "k3"}, ("a",))
+    assert assimilated(1, b=2, c=3) == {"k1": 1, "k2": 2, "k3": 3}
+    with pytest.raises(TypeError):
+        assimilated(1, 2, 3)
+
+
+def pytest_extra_native_arguments_are_ignored():
+    assimilated = assimilate_function(
+        _foreign, {"a": "k1", "b": "k2", "c": "k3"}, ("a", "b", "c"))
+    assert assimilated(1, 2, 3, d=4) == {"k1": 1, "k2": 2, "k3": 3}
+
+
+def pytest_empty_translation_table():
+    def foreign(k1=None):
+        return k1
+
+    assimilated = assimilate_function(foreign, {}, ("a", "b"))
+    assert assimilated() is None
+    assert assimilated(1, 2, c=3) is None
+
+
+def pytest_missing_native_argument():
+    assimilated = assimilate_function(
+        _foreign, {"a": "k1", "b": "k2", "c": "k3"}, ("a", "b", "c"))
+    with pytest.raises(TypeError, match="Missing native kwarg `b`"):
+        assimilated(1, c=3)
+    with pytest.raises(TypeError, match="Missing native kwarg `c`"):
+        assimilate_function(_foreign, {"a": "k1", "b": "k2", "c": "k3"})(a=1, b=2)
+
+
+def pytest_invocation_logging_follows_the_level_at_call_time(caplog):
+    """registered before logging is set up, invocations are logged anyway"""
+    def system_setup():
+        return "done"
+
+    callback = SystemSetupCallback()
+    with caplog.at_level(logging.INFO):
+        callback.register(system_setup)
+        assert callback(ExitStack()) == "done"
+    assert "Invoking foreign" not in caplog.text
+    with caplog.at_level(logging.DEBUG):
+        assert callback(ExitStack()) == "done"
+    assert "Invoking foreign" in caplog.text
+    assert "system_setup" in caplog.text
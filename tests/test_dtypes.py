@@ -0,0 +1,37 @@
+import pytest
+
+from the_test_framework.core import TestResult, TestResultInfo
+from the_test_framework.core.dtypes import TestStepResultInfo
+
+
+def _step_result_info(result: TestResult) -> TestStepResultInfo[None]:
+    return TestStepResultInfo(name="step", result=result, uuid="",
+                              returned=None, log=[], embedded_results=[])
+
+
+@pytest.mark.parametrize("a, b, expected", [
+    (TestResult.SUCCESS, TestResult.SUCCESS, TestResult.SUCCESS),
+    (TestResult.SUCCESS, TestResult.FAILED, TestResult.FAILED),
+    (TestResult.FAILED, TestResult.SUCCESS, TestResult.FAILED),
+    (TestResult.FAILED, TestResult.EXCEPTION, TestResult.EXCEPTION),
+    (TestResult.EXCEPTION, TestResult.SUCCESS, TestResult.EXCEPTION),
+])
+def pytest_test_result_merge(a: TestResult, b: TestResult, expected: TestResult):
+    assert a.merge(b) is expected
+
+
+def pytest_test_result_merge_rejects_foreign_types():
+    with pytest.raises(TypeError):
+        TestResult.SUCCESS.merge(True)  # pyright: ignore
+
+
+def pytest_test_result_info_tracks_merged_result():
+    info = TestResultInfo(steps=[_step_result_info(TestResult.SUCCESS)])
+    assert info
+    info.append(_step_result_info(TestResult.FAILED))
+    assert not info
+    assert info.result is TestResult.FAILED
+
+    info.steps[1] = _step_result_info(TestResult.SUCCESS)
+    info.recompute()
+    assert info
@@ -0,0 +1,66 @@
+import threading
+import time
+from contextlib import contextmanager
+
+from the_test_framework.core.monitor import (
+    TestSystemMonitor,
+    TASK_GRACE_PERIOD,
+    TASK_START_POLL_INTERVAL,
+)
+
+
+@contextmanager
+def running_monitor():
+    monitor = TestSystemMonitor()
+    loop = threading.Thread(target=monitor.monitor_loop, daemon=True)
+    loop.start()
+    try:
+        yield monitor
+    finally:
+        monitor.quit()
+        loop.join(timeout=2)
+
+
+def _await_errors(monitor: TestSystemMonitor, timeout: float) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if monitor.wrecked:
+            return True
+        time.sleep(0.01)
+    return monitor.wrecked
+
+
+def pytest_task_removed_after_termination_is_no_error():
+    """a task ending within its `with monitor.task()` block is fine"""
+    with running_monitor() as monitor:
+        for _ in range(20):
+            task = threading.Thread(target=lambda: None)
+            with monitor.task(task):
+                task.start()
+                task.join()
+        assert not _await_errors(monitor, 2 * TASK_GRACE_PERIOD)
+
+
+def pytest_dead_task_is_reported():
+    with running_monitor() as monitor:
+        task = threading.Thread(target=time.sleep, args=(0.1,))
+        task.start()
+        monitor.add_task(task)
+        assert _await_errors(monitor, 0.1 + TASK_GRACE_PERIOD + 0.5)
+        assert "seem to be dead" in monitor.errors[0].message
+
+
+def pytest_task_added_before_start_is_watched():
+    """the death of a task, which was added before it started, is noticed"""
+    with running_monitor() as monitor:
+        task = threading.Thread(target=time.sleep, args=(0.1,))
+        monitor.add_task(task)
+        task.start()
+        assert _await_errors(
+            monitor, TASK_START_POLL_INTERVAL + TASK_GRACE_PERIOD + 0.5)
+
+
+def pytest_unstarted_task_is_reported():
+    with running_monitor() as monitor:
+        monitor.add_task(threading.Thread(target=lambda: None))
+        assert _await_errors(monitor, TASK_START_POLL_INTERVAL + 0.5)
@@ -1,5 +1,13 @@
+from logging import getLogger
+from types import SimpleNamespace
+
 import pytest
 from the_test_framework.core import test_step, TestSystem, QuitTestSystem
+from the_test_framework.core.dtypes import TestResult
+from the_test_framework.core.sequence.supervision import TestSequenceSupervision
+
+
+logger = getLogger(__name__)
 
 
 @pytest.fixture(name="test_system")
@@ -32,3 +40,53 @@ def pytest_test_step(test_system: TestSystem):
         some_test()
 
     test_system()
+
+
+def pytest_repeated_test_step_keeps_each_attempt():
+    sequence_supervision, step_supervisor = (
+        TestSequenceSupervision.setup_supervision())
+    repeat = iter([True, False])
+    test_system = SimpleNamespace(test_step_supervisor=step_supervisor,
+                                  repeat_test_step=lambda step: next(repeat))
+    attempts = []
+
+    @test_step(name="Flaky Test")
+    def flaky():
+        attempts.append(None)
+        return TestResult.FAILED if len(attempts) == 1 else TestResult.SUCCESS
+
+    assert flaky._call_as_part_of_a_test_system(test_system) is TestResult.SUCCESS
+    # each attempt is kept, with an outcome of its own
+    first, second = sequence_supervision.metadata
+    assert first is not second
+    assert first.test_result is TestResult.FAILED
+    assert second.test_result is TestResult.SUCCESS
+
+
+def pytest_log_records_are_bounded():
+    """only the most recent `max_log_records` records of a step are kept"""
+    test_system = TestSystem(max_log_records=3)
+    state = {"terminate": False}
+
+    @test_system.uut_setup
+    def uut_setup():
+        if state["terminate"]:
+            raise QuitTestSystem()
+        state["terminate"] = True
+
+    @test_step(name="Noisy Test")
+    def noisy_test():
+        for i in range(10):
+            logger.warning("record %d", i)
+
+    finished = []
+
+    @test_system.test_sequence
+    def sequence():
+        noisy_test()
+        finished.append(test_system.test_step_supervisor.latest_test_step)
+
+    test_system()
+    (metadata,) = finished
+    assert [r.getMessage() for r in metadata.log_messages] == [
+        "record 7", "record 8", "record 9"]
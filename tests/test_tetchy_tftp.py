@@ -0,0 +1,286 @@
+import os
+import socket
+import struct
+import threading
+import time
+from multiprocessing import Value
+
+import pytest
+
+from the_test_framework.facilities.tetchy_tftp import (
+    TetchyTFTPServer,
+    MAX_WINDOWSIZE,
+    OP_ACK,
+    OP_DATA,
+    OP_ERROR,
+    OP_OACK,
+)
+
+
+@pytest.fixture(name="server")
+def get_running_server(tmp_path):
+    """TetchyTFTPServer serving `tmp_path` on an ephemeral port"""
+    running = Value("b", True)
+    server = TetchyTFTPServer(str(tmp_path), host="127.0.0.1", port=0,
+                              timeout=0.3, retries=3, running=running)
+    serving = threading.Thread(target=server.serve, daemon=True)
+    serving.start()
+    while server._sock is None or server._sock.getsockname()[1] == 0:
+        time.sleep(0.01)
+    yield server
+    running.value = False
+    serving.join(timeout=5)
+
+
+def _request(filename: str, **opts) -> bytes:
+    request = struct.pack(">H", 1) + filename.encode() + b"\x00octet\x00"
+    for name, value in opts.items():
+        request += f"{name}\x00{value}\x00".encode()
+    return request
+
+
+def _client_socket() -> socket.socket:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    # whole windows arrive in bursts
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4 * 1024 * 1024)
+    sock.settimeout(2)
+    return sock
+
+
+def _oack_options(pkt: bytes) -> dict[str, int]:
+    fields = pkt[2:].split(b"\x00")
+    return {k.decode(): int(v) for k, v in zip(fields[::2], fields[1::2])}
+
+
+class Client:
+    """minimal RRQ client, which ACKs as RFC 7440 demands"""
+    def __init__(self, server: TetchyTFTPServer):
+        self.server_addr = server._sock.getsockname()
+        self.sock = _client_socket()
+        self.received: list[int] = []  # all DATA block numbers, as received
+
+    def ack(self, addr, block: int):
+        self.sock.sendto(struct.pack(">HH", OP_ACK, block), addr)
+
+    def read(self, filename: str, windowsize: int = 1, blksize: int = 512,
+             drop: set[int] = frozenset()) -> bytes:
+        """read `filename`, ignoring the first reception of blocks in `drop`"""
+        opts = {"blksize": blksize}
+        if windowsize > 1:
+            opts["windowsize"] = windowsize
+        self.sock.sendto(_request(filename, **opts), self.server_addr)
+        pkt, addr = self.sock.recvfrom(70000)
+        assert struct.unpack_from(">H", pkt)[0] == OP_OACK
+        assert _oack_options(pkt).get("windowsize", 1) == windowsize
+        self.ack(addr, 0)
+
+        drop = set(drop)
+        content = []
+        expected = 1
+        in_window = 0
+        while True:
+            pkt, addr = self.sock.recvfrom(70000)
+            opcode, block = struct.unpack_from(">HH", pkt)
+            assert opcode == OP_DATA
+            self.received.append(block)
+            if block in drop:
+                drop.discard(block)
+                continue
+            if block != expected:
+                # gap - ACK the last block received in order
+                self.ack(addr, (expected - 2) % 0xFFFF + 1)
+                in_window = 0
+                continue
+            content.append(pkt[4:])
+            expected = expected % 0xFFFF + 1
+            in_window += 1
+            last = len(pkt) - 4 < blksize
+            if in_window == windowsize or last:
+                self.ack(addr, block)
+                in_window = 0
+            if last:
+                return b"".join(content)
+
+
+@pytest.mark.parametrize("size", [0, 100, 512 * 3, 5000])
+@pytest.mark.parametrize("windowsize", [1, 4])
+def pytest_rrq(server, tmp_path, size, windowsize):
+    content = os.urandom(size)
+    (tmp_path / "file.bin").write_bytes(content)
+    assert Client(server).read("file.bin", windowsize) == content
+
+
+def pytest_rrq_partial_last_window(server, tmp_path):
+    """the last window holds fewer blocks than negotiated"""
+    content = os.urandom(512 * 10 + 7)
+    (tmp_path / "file.bin").write_bytes(content)
+    client = Client(server)
+    assert client.read("file.bin", windowsize=4) == content
+    assert client.received == list(range(1, 12))
+
+
+def pytest_rrq_window_resumes_after_gap(server, tmp_path):
+    content = os.urandom(512 * 20)
+    (tmp_path / "file.bin").write_bytes(content)
+    client = Client(server)
+    assert client.read("file.bin", windowsize=8, drop={5, 14}) == content
+    # the window following an ACK of block 4 starts over at block 5
+    resumed = client.received.index(5, client.received.index(5) + 1)
+    assert client.received[resumed:resumed + 8] == list(range(5, 13))
+
+
+def pytest_rrq_block_number_rollover(server, tmp_path):
+    content = os.urandom(8 * 0x10000 + 3)
+    (tmp_path / "file.bin").write_bytes(content)
+    client = Client(server)
+    assert client.read("file.bin", windowsize=64, blksize=8) == content
+    assert client.received[0xFFFF - 1:0xFFFF + 1] == [0xFFFF, 1]
+
+
+def pytest_windowsize_is_capped(server, tmp_path):
+    (tmp_path / "file.bin").write_bytes(b"x")
+    sock = _client_socket()
+    sock.sendto(_request("file.bin", windowsize=65535),
+                server._sock.getsockname())
+    pkt, _ = sock.recvfrom(2048)
+    assert _oack_options(pkt)["windowsize"] == MAX_WINDOWSIZE
+
+
+def pytest_stale_ack_is_ignored(server, tmp_path):
+    """a duplicate ACK of a previous window must not advance the transfer"""
+    content = os.urandom(512 * 3 * MAX_WINDOWSIZE)
+    (tmp_path / "file.bin").write_bytes(content)
+    sock = _client_socket()
+    sock.sendto(_request("file.bin", windowsize=MAX_WINDOWSIZE),
+                server._sock.getsockname())
+    _, addr = sock.recvfrom(2048)
+    sock.sendto(struct.pack(">HH", OP_ACK, 0), addr)
+    for _ in range(MAX_WINDOWSIZE):
+        sock.recvfrom(2048)
+    # ACK the first window twice - the second one is stale
+    for _ in range(2):
+        sock.sendto(struct.pack(">HH", OP_ACK, MAX_WINDOWSIZE), addr)
+    blocks = [struct.unpack_from(">HH", sock.recvfrom(2048)[0])[1]
+              for _ in range(MAX_WINDOWSIZE)]
+    assert blocks == list(range(MAX_WINDOWSIZE + 1, 2 * MAX_WINDOWSIZE + 1))
+
+
+def pytest_rrq_of_missing_file(server):
+    sock = _client_socket()
+    sock.sendto(_request("missing.bin"), server._sock.getsockname())
+    pkt, _ = sock.recvfrom(2048)
+    assert struct.unpack_from(">H", pkt)[0] == OP_ERROR
+
+
+def pytest_rrq_of_file_truncated_while_served(server, tmp_path):
+    """a file truncated mid-transfer comes out short, the server survives"""
+    server.file_cache_bytes = 0
+    content = os.urandom(512 * 20)
+    path = tmp_path / "file.bin"
+    path.write_bytes(content)
+    sock = _client_socket()
+    sock.sendto(_request("file.bin"), server._sock.getsockname())
+    received = []
+    while True:
+        pkt, addr = sock.recvfrom(2048)
+        opcode, block = struct.unpack_from(">HH", pkt)
+        assert opcode == OP_DATA
+        received.append(pkt[4:])
+        if block == 2:
+            with open(path, "r+b") as f:
+                f.truncate(512 * 3 + 10)
+        sock.sendto(struct.pack(">HH", OP_ACK, block), addr)
+        if len(pkt) - 4 < 512:
+            break
+    assert b"".join(received) == content[:512 * 3 + 10]
+    assert Client(server).read("file.bin") == content[:512 * 3 + 10]
+
+
+def pytest_rrq_of_cached_file_rewritten_while_served(server, tmp_path):
+    """a transfer from a cached copy is unaffected by rewriting the file"""
+    content = os.urandom(512 * 20)
+    path = tmp_path / "file.bin"
+    path.write_bytes(content)
+    assert Client(server).read("file.bin") == content
+    sock = _client_socket()
+    sock.sendto(_request("file.bin"), server._sock.getsockname())
+    received = []
+    rewritten = os.urandom(512 * 3 + 10)
+    while True:
+        pkt, addr = sock.recvfrom(2048)
+        opcode, block = struct.unpack_from(">HH", pkt)
+        assert opcode == OP_DATA
+        received.append(pkt[4:])
+        if block == 2:
+            path.write_bytes(rewritten)
+        sock.sendto(struct.pack(">HH", OP_ACK, block), addr)
+        if len(pkt) - 4 < 512:
+            break
+    assert b"".join(received) == content
+    assert Client(server).read("file.bin") == rewritten
+
+
+def pytest_file_cache_is_bounded(server, tmp_path):
+    server.file_cache_bytes = 3 * 1000
+    for name in "abcd":
+        (tmp_path / name).write_bytes(name.encode() * 1000)
+        assert Client(server).read(name) == name.encode() * 1000
+    assert list(server._file_cache) == [str(tmp_path / name) for name in "bcd"]
+    assert server._file_cache_size == 3 * 1000
+
+
+def pytest_failing_transfer_is_reported(server, tmp_path, monkeypatch):
+    (tmp_path / "file.bin").write_bytes(b"x")
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(server, "_block_reader", fail)
+    ended = threading.Event()
+    errors = []
+
+    def on_ended(transfer_id: str, error: str | None = None):
+        errors.append(error)
+        ended.set()
+
+    server.ipc.subscribe(transfer_ended_callback=on_ended)
+    sock = _client_socket()
+    sock.sendto(_request("file.bin"), server._sock.getsockname())
+    pkt, _ = sock.recvfrom(2048)
+    assert struct.unpack_from(">H", pkt)[0] == OP_ERROR
+    assert ended.wait(2)
+    assert errors == ["internal error"]
+    monkeypatch.undo()
+    assert Client(server).read("file.bin") == b"x"
+
+
+def pytest_repeated_request_starts_no_transfer(server, tmp_path):
+    (tmp_path / "file.bin").write_bytes(b"x" * 2048)
+    sock = _client_socket()
+    sock.settimeout(3 * server.timeout)
+    for _ in range(3):
+        sock.sendto(_request("file.bin", blksize=512), server._sock.getsockname())
+    # unACKed, the server retransmits until giving up - all from one TID
+    sources = set()
+    try:
+        while True:
+            _, addr = sock.recvfrom(2048)
+            sources.add(addr)
+    except socket.timeout:
+        pass
+    assert len(sources) == 1
+
+
+def pytest_request_beyond_queue_is_turned_down(server, tmp_path):
+    (tmp_path / "file.bin").write_bytes(b"x")
+    server.max_concurrent_transfers = 1
+    server.max_queued_requests = 0
+    pending = _client_socket()
+    pending.sendto(_request("file.bin", blksize=512), server._sock.getsockname())
+    pkt, _ = pending.recvfrom(2048)
+    assert struct.unpack_from(">H", pkt)[0] == OP_OACK
+    sock = _client_socket()
+    sock.sendto(_request("file.bin"), server._sock.getsockname())
+    pkt, _ = sock.recvfrom(2048)
+    assert struct.unpack_from(">HH", pkt) == (OP_ERROR, 0)
+    assert pkt[4:-1] == b"Server busy"